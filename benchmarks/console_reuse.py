@@ -0,0 +1,78 @@
+"""Allocations of a Console per table versus one reused RenderContext
+
+    python benchmarks/console_reuse.py --tables 49 --devices 20
+
+Renders the text and SVG of every OpenConfig and IOS-XE check for each
+device, the way run_check does for failed checks, once with a new
+Console(record=True) per table and once through report.RenderContext.
+Reports wall time, the number of allocated memory blocks and bytes, and the
+traced peak of each strategy.
+"""
+import os
+import sys
+import time
+import argparse
+import itertools
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from checks import OPENCONFIG, IOS_XE_OPER
+from engine import evaluate
+from report import Report, RenderContext, build_table, render
+from payloads import document
+
+def per_table(alias, check, verdicts):
+    console, text = render(build_table(alias, check, verdicts))
+    return text, console.export_svg(title=f"{ alias } { check.title }")
+
+def make_shared():
+    context = RenderContext()
+    def shared(alias, check, verdicts):
+        report = Report(alias, check, verdicts, context)
+        return report.text, report.svg
+    return shared
+
+def workload(args):
+    """(alias, check, verdicts) for every table of the run"""
+    jobs = []
+    for model in (OPENCONFIG, IOS_XE_OPER):
+        verdicts = evaluate(document(model, args.interfaces, 0.5)[model.path]['interface'], model.rules)
+        jobs += [(check, verdicts[check.uid]) for check in model.checks]
+    jobs = list(itertools.islice(itertools.cycle(jobs), args.tables))
+    return [(f"device-{ device }", check, verdicts) for device in range(args.devices) for check, verdicts in jobs]
+
+def measure(strategy, jobs):
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    start = time.perf_counter()
+    kept = None
+    for job in jobs:
+        kept = strategy(*job)
+    elapsed = time.perf_counter() - start
+    after = tracemalloc.take_snapshot()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    # Everything allocated along the way, freed or not, shows up in the peak;
+    # what is still held shows up in the snapshot difference
+    held = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, 'filename'))
+    del kept
+    return elapsed, peak, held, blocks
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--devices', type=int, default=20)
+    parser.add_argument('--tables', type=int, default=49, help='Tables per device')
+    parser.add_argument('--interfaces', type=int, default=24)
+    args = parser.parse_args()
+
+    jobs = workload(args)
+    print(f"{ len(jobs) } tables, { args.interfaces } interfaces each")
+    print(f"{ 'strategy':<12}{ 'seconds':>10}{ 'ms/table':>10}{ 'peak KiB':>12}{ 'held KiB':>12}{ 'blocks':>10}")
+    for name, strategy in (('per-table', per_table), ('shared', make_shared())):
+        elapsed, peak, held, blocks = measure(strategy, jobs)
+        print(f"{ name:<12}{ elapsed:>10.2f}{ elapsed / len(jobs) * 1e3:>10.2f}{ peak / 1024:>12.0f}{ held / 1024:>12.0f}{ blocks:>10}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+"""Offline load test of the ChatGPT enrichment of the failures
+
+    python benchmarks/enrichment.py --devices 50 --failure-ratio 0.2 --latency 0.5
+
+Emits the failure events of every OpenConfig and IOS-XE check for each
+device, the way the testcases do, then runs the post-run stage over them
+with the deterministic llm.StubProvider standing in for OpenAI: no key, no
+network, no cost.  --latency makes every stub completion sleep like a round
+trip.  WebEx is left out, so the stage only asks the questions.
+
+For both ChatGPT modes it reports the completions made, the wall time, and
+the overhead of the stage on top of the latency its worker pool has to wait
+out at the least.
+"""
+import os
+import sys
+import math
+import time
+import shutil
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import llm
+import events
+import metrics
+import postprocess
+from chatgpt import MODES, MAX_CONCURRENCY
+from checks import OPENCONFIG, IOS_XE_OPER
+from engine import evaluate
+from payloads import document
+
+# Nothing may reach WebEx, whatever the environment or the .env file postprocess loaded holds
+postprocess.webexToken = None
+
+def emit(directory, args):
+    """Events of every failed check on every device, returns how many"""
+    emitter = events.Emitter(directory)
+    count = 0
+    for device in range(args.devices):
+        for model in (OPENCONFIG, IOS_XE_OPER):
+            verdicts = evaluate(document(model, args.interfaces, args.failure_ratio, f"device-{ device }")[model.path]['interface'], model.rules)
+            for check in model.checks:
+                if any(verdict.failed for verdict in verdicts[check.uid]):
+                    emitter.emit(events.failure(f"device-{ device }", check, verdicts[check.uid]))
+                    count += 1
+    emitter.close()
+    return count
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--devices', type=int, default=50)
+    parser.add_argument('--interfaces', type=int, default=24)
+    parser.add_argument('--failure-ratio', type=float, default=0.2)
+    parser.add_argument('--latency', type=float, default=0.0, help='Seconds every stub completion takes')
+    parser.add_argument('--workers', type=int, default=MAX_CONCURRENCY, help='Completions in flight at once')
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp(prefix='brainiac_events_')
+    try:
+        failures = emit(directory, args)
+        print(f"{ failures } failed checks on { args.devices } devices, { args.latency }s per completion, { args.workers } workers")
+        print(f"{ 'mode':<12}{ 'completions':>12}{ 'seconds':>10}{ 'bound':>10}{ 'overhead ms':>13}")
+        for mode in MODES:
+            del metrics.records[:]
+            start = time.perf_counter()
+            postprocess.run(directory, chatgpt_workers=args.workers, chatgpt_cache=None, chatgpt_mode=mode,
+                            llm_provider=llm.StubProvider(args.latency))
+            elapsed = time.perf_counter() - start
+            calls = sum(1 for record in metrics.records if record['name'] == llm.StubProvider.name)
+            bound = math.ceil(calls / args.workers) * args.latency
+            print(f"{ mode:<12}{ calls:>12}{ elapsed:>10.2f}{ bound:>10.2f}{ (elapsed - bound) / max(calls, 1) * 1e3:>13.3f}")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,129 @@
+"""Stand-in RESTCONF server for load and scale benchmarks
+
+    python benchmarks/fake_restconf.py --interfaces 48 --latency 80 --jitter 40
+    python benchmarks/testbed_generator.py --devices 100 --output testbed_100.yaml
+    pyats run job brainiac_job.py --testbed-file testbed_100.yaml
+
+Serves synthetic openconfig-interfaces, Cisco-IOS-XE-interfaces-oper and
+ietf-interfaces documents built from the check registry, honouring fields=
+queries.  Every 127.x.y.z address is a different device: the server listens
+on all of them and tells devices apart by the address in the Host header, so
+one process stands in for thousands of routers.  Each device's documents are
+seeded by its address and stay the same across requests.
+"""
+import os
+import sys
+import time
+import random
+import argparse
+import functools
+from urllib.parse import urlsplit, unquote
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import serializer
+from checks import MODELS
+from payloads import document
+
+PREFIX = '/restconf/data/'
+
+def select(intf, leaves):
+    """Copy only the leaves of a fields= expression out of an interface element"""
+    selected = {}
+    for leaf in leaves:
+        source, target = intf, selected
+        for key in leaf[:-1]:
+            if not isinstance(source.get(key), dict):
+                break
+            source = source[key]
+            target = target.setdefault(key, {})
+        else:
+            if leaf[-1] in source:
+                target[leaf[-1]] = source[leaf[-1]]
+    return selected
+
+def narrow(payload, path, fields):
+    """Apply fields=interface(a;b/c;...) to a document"""
+    leaves = [tuple(leaf.split('/')) for leaf in fields[len('interface('):-1].split(';')]
+    return {path: {'interface': [select(intf, leaves) for intf in payload[path]['interface']]}}
+
+class RestconfHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        settings = self.server.settings
+        delay = settings.latency + random.uniform(-settings.jitter, settings.jitter)
+        time.sleep(max(delay, 0) / 1000)
+        if random.random() < settings.error_rate:
+            return self.reply(503, b'{"errors": {"error": [{"error-tag": "resource-denied"}]}}')
+        url = urlsplit(self.path)
+        if not url.path.startswith(PREFIX):
+            return self.reply(200, b'{}')
+        path = unquote(url.path[len(PREFIX):])
+        query = dict(part.split('=', 1) for part in unquote(url.query).split('&') if '=' in part)
+        fields = query.get('fields')
+        if fields and settings.reject_fields:
+            return self.reply(400, b'{"errors": {"error": [{"error-tag": "invalid-value"}]}}')
+        host = self.headers.get('Host', 'localhost').rsplit(':', 1)[0]
+        body = self.server.body(host, path, fields)
+        if body is None:
+            # rest.connector's connect() probes Cisco-IOS-XE-native:native/version, it and any
+            # other resource outside the checks just need a 200
+            return self.reply(200, b'{}')
+        self.reply(200, body)
+
+    def reply(self, status, body):
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/yang-data+json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if self.server.settings.verbose:
+            super().log_message(format, *args)
+
+class RestconfServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, settings):
+        super().__init__(address, RestconfHandler)
+        self.settings = settings
+        self.models = {model.path: model for model in MODELS}
+        self.body = functools.lru_cache(maxsize=settings.cached_documents)(self.render)
+
+    def render(self, host, path, fields=None):
+        """Encoded reply for one device and resource, None for unknown models"""
+        model = self.models.get(path)
+        if model is None:
+            return None
+        seed = f"{ host } { path }"
+        payload = document(model, self.settings.interfaces, self.settings.failure_rate, seed)
+        if fields:
+            payload = narrow(payload, path, fields)
+        return serializer.dumps(payload)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--host', default='0.0.0.0', help='Address to listen on, 0.0.0.0 covers every 127.x.y.z device')
+    parser.add_argument('--port', type=int, default=8443)
+    parser.add_argument('--interfaces', type=int, default=48, help='Interfaces per device and model')
+    parser.add_argument('--failure-rate', type=float, default=0.01, help='Share of interface checks that fail')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Share of requests answered with 503')
+    parser.add_argument('--latency', type=float, default=0.0, help='Mean response latency in ms')
+    parser.add_argument('--jitter', type=float, default=0.0, help='Latency varies uniformly by up to this many ms')
+    parser.add_argument('--reject-fields', action='store_true', help='Answer fields= queries with 400 like agents without support')
+    parser.add_argument('--cached-documents', type=int, default=4096, help='Encoded replies kept in memory')
+    parser.add_argument('--verbose', action='store_true', help='Log every request')
+    settings = parser.parse_args()
+
+    server = RestconfServer((settings.host, settings.port), settings)
+    print(f"Serving RESTCONF on { settings.host }:{ settings.port }, { settings.interfaces } interfaces per model")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == '__main__':
+    main()
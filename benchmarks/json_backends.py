@@ -0,0 +1,46 @@
+"""Decode and encode time of each installed JSON backend
+
+    python benchmarks/json_backends.py --interfaces 5000
+
+Times serializer.loads() of a synthetic Cisco-IOS-XE-interfaces-oper
+reply and serializer.dumps() of the decoded payload, compact (response
+cache) and pretty (JSON/ snapshots), keeping the best of --repeat runs.
+"""
+import os
+import sys
+import argparse
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import serializer
+from checks import IOS_XE_OPER
+from payloads import document
+
+def measure(function, repeat, number):
+    return min(timeit.repeat(function, repeat=repeat, number=number)) / number
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--interfaces', type=int, default=5000)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--number', type=int, default=3)
+    args = parser.parse_args()
+
+    payload = document(IOS_XE_OPER, args.interfaces)
+    body = serializer.StdlibBackend().dumps(payload)
+    print(f"{ args.interfaces } interfaces, { len(body) / 1e6:.1f} MB reply")
+    print(f"{ 'backend':<10}{ 'decode ms':>12}{ 'encode ms':>12}{ 'pretty ms':>12}")
+    for name, backend in serializer.BACKENDS.items():
+        try:
+            backend = backend()
+        except ImportError:
+            print(f"{ name:<10}{ 'not installed':>12}")
+            continue
+        decode = measure(lambda: backend.loads(body), args.repeat, args.number)
+        encode = measure(lambda: backend.dumps(payload), args.repeat, args.number)
+        pretty = measure(lambda: backend.dumps(payload, pretty=True), args.repeat, args.number)
+        print(f"{ name:<10}{ decode * 1e3:>12.1f}{ encode * 1e3:>12.1f}{ pretty * 1e3:>12.1f}")
+
+if __name__ == '__main__':
+    main()
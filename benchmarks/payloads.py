@@ -0,0 +1,42 @@
+"""Synthetic RESTCONF documents for the benchmarks
+
+Documents are generated from the check registry, so every leaf a check
+reads is present with a passing value, or a failing one for roughly
+error_rate of the interfaces and checks.
+"""
+import os
+import sys
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine import CounterRule, MatchRule, AdminOperRule, DescriptionRule
+
+def assign(intf, path, value):
+    """Set a leaf, creating the containers on the way"""
+    for key in path[:-1]:
+        intf = intf.setdefault(key, {})
+    intf[path[-1]] = value
+
+def interface(model, index, error_rate=0.0, rng=random):
+    """One interface element carrying every leaf the checks of the model read"""
+    intf = {'name': f"GigabitEthernet1/0/{ index }", 'type': 'iana-if-type:ethernetCsmacd', 'enabled': True}
+    for rule in model.rules:
+        failing = rng.random() < error_rate
+        if isinstance(rule, CounterRule):
+            assign(intf, rule.path, str(rng.randint(rule.threshold + 1, 100000)) if failing else '0')
+        elif isinstance(rule, MatchRule):
+            assign(intf, rule.path, 'HALF' if failing else rule.expected)
+        elif isinstance(rule, AdminOperRule):
+            admin_status = next(iter(rule.expected)) if rule.expected else 'UP'
+            oper_status = rule.expected[admin_status] if rule.expected else admin_status
+            assign(intf, rule.path + ('admin-status',), admin_status)
+            assign(intf, rule.path + ('oper-status',), 'DOWN' if failing else oper_status)
+        elif isinstance(rule, DescriptionRule):
+            assign(intf, rule.path, '' if failing else f"Uplink { index }")
+    return intf
+
+def document(model, interfaces, error_rate=0.0, seed=0):
+    """A RESTCONF reply for the model with the given number of interfaces"""
+    rng = random.Random(seed)
+    return {model.path: {'interface': [interface(model, index, error_rate, rng) for index in range(interfaces)]}}
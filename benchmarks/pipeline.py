@@ -0,0 +1,202 @@
+"""End-to-end benchmark of the brainiac pipeline, stage by stage
+
+    python benchmarks/pipeline.py --interfaces 10 100 1000 --failure-ratios 0 0.01 0.1
+
+For every interface count and failure ratio each YANG model goes through
+the same steps as a testcase: RESTCONF fetch from an in-process
+fake_restconf.py, JSON decode, snapshot write, evaluation, and for every
+check the Rich table render and SVG export (--artifacts).  Failed checks rasterize
+their PNG into a WebEx digest, which is read out as one MP3 and posted to a
+local WebEx mock once per scenario run.  gTTS needs Google's service, so it is
+only timed with --tts; otherwise the digest carries a placeholder MP3.
+
+Results go to --output as JSON, one record per scenario holding the calls,
+seconds and bytes of every stage, to compare across releases.
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import platform
+import argparse
+import tempfile
+import threading
+import subprocess
+from collections import defaultdict
+from contextlib import contextmanager
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import requests
+import serializer
+import snapshot
+from checks import MODELS
+from engine import evaluate
+from report import Report, ARTIFACTS, rasterize
+from webex import Digest
+from fake_restconf import RestconfServer
+
+STAGES = ['fetch', 'decode', 'snapshot', 'evaluate', 'table', 'save_svg', 'svg2png', 'gtts', 'webex']
+
+ALIAS = 'bench'
+
+class Stages:
+    """Accumulated calls, seconds and bytes per stage"""
+
+    def __init__(self):
+        self.totals = defaultdict(lambda: {'calls': 0, 'seconds': 0.0, 'bytes': 0})
+
+    @contextmanager
+    def time(self, stage):
+        record = self.totals[stage]
+        start = time.perf_counter()
+        yield record
+        record['seconds'] += time.perf_counter() - start
+        record['calls'] += 1
+
+    def as_dict(self):
+        return {stage: dict(self.totals[stage]) for stage in STAGES if stage in self.totals}
+
+class WebexMock(BaseHTTPRequestHandler):
+    """Accepts POST /v1/messages like webexapis.com and discards the body"""
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        body = b'{"id": "mock"}'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+def serve(server):
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{ server.server_address[1] }"
+
+def send(args, stages, url, digest, workdir):
+    """Read out and post the digest, as CommonCleanup does"""
+    if not digest:
+        return
+    mp3 = os.path.join(workdir, f"{ digest.title }.mp3")
+    if args.tts:
+        from gtts import gTTS
+        with stages.time('gtts') as record:
+            gTTS(text=digest.speech, lang='en').save(mp3)
+            record['bytes'] += os.path.getsize(mp3)
+        with open(mp3, 'rb') as f:
+            audio = f.read()
+    else:
+        audio = b'\0' * 16384
+    digest.add_file(os.path.basename(mp3), audio)
+    with stages.time('webex') as record:
+        record['bytes'] += len(digest.archive())
+        digest.send('bench', 'bench', url=f"{ url }/v1/messages")
+
+def scenario(args, interfaces, failure_ratio, webex_url, workdir):
+    settings = argparse.Namespace(interfaces=interfaces, failure_rate=failure_ratio, error_rate=0.0, latency=0.0,
+                                  jitter=0.0, reject_fields=False, cached_documents=16, verbose=False)
+    restconf = RestconfServer(('127.0.0.1', 0), settings)
+    base_url = serve(restconf)
+    session = requests.Session()
+    stages = Stages()
+    try:
+        for _ in range(args.repeat):
+            digest = Digest(ALIAS)
+            for model in MODELS:
+                resource = f"{ model.path }?fields={ model.fields }" if args.targeted else model.path
+                with stages.time('fetch') as record:
+                    body = session.get(f"{ base_url }/restconf/data/{ resource }").content
+                    record['bytes'] += len(body)
+                with stages.time('decode') as record:
+                    payload = serializer.loads(body)
+                    record['bytes'] += len(body)
+                with stages.time('snapshot') as record:
+                    name = snapshot.dump(payload, ALIAS, model, args.snapshot_format, workdir)
+                    record['bytes'] += os.path.getsize(name)
+                with stages.time('evaluate'):
+                    verdicts = evaluate(payload[model.path]['interface'], model.rules)
+                for check in model.checks:
+                    report = Report(ALIAS, check, verdicts[check.uid])
+                    failed = report.failed
+                    if failed or args.artifacts == 'all':
+                        with stages.time('table'):
+                            report.text
+                    if report.wants_svg(args.artifacts):
+                        with stages.time('save_svg') as record:
+                            with open(os.path.join(workdir, f"{ report.title }.svg"), 'w', encoding='utf-8') as f:
+                                f.write(report.svg)
+                            record['bytes'] += len(report.svg)
+                    if failed:
+                        digest.add(ALIAS, check, failed)
+                        # Only the PNGs WebEx gets are rasterized
+                        with stages.time('svg2png') as record:
+                            png = rasterize(report.svg)[0]
+                            record['bytes'] += len(png)
+                        digest.add_file(f"{ ALIAS } { check.title }.png", png)
+            send(args, stages, webex_url, digest, workdir)
+    finally:
+        restconf.shutdown()
+        restconf.server_close()
+    return stages.as_dict()
+
+def revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        return None
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--interfaces', type=int, nargs='+', default=[10, 100, 1000])
+    parser.add_argument('--failure-ratios', type=float, nargs='+', default=[0.0, 0.01, 0.1])
+    parser.add_argument('--repeat', type=int, default=1, help='Runs of every scenario, stage totals are summed')
+    parser.add_argument('--artifacts', choices=ARTIFACTS, default='all',
+                        help='Checks rendered and saved as SVG; failed mirrors the job default, all times every table')
+    parser.add_argument('--snapshot-format', choices=list(snapshot.EXTENSIONS), default='json')
+    parser.add_argument('--full-tree', dest='targeted', action='store_false', help='Fetch without fields=')
+    parser.add_argument('--tts', action='store_true', help='Time real gTTS calls, needs internet access')
+    parser.add_argument('--output', default='benchmark_results.json')
+    args = parser.parse_args()
+
+    webex = ThreadingHTTPServer(('127.0.0.1', 0), WebexMock)
+    webex.daemon_threads = True
+    webex_url = serve(webex)
+    results = []
+    for interfaces in args.interfaces:
+        for failure_ratio in args.failure_ratios:
+            workdir = tempfile.mkdtemp(prefix='brainiac_bench_')
+            try:
+                start = time.perf_counter()
+                stages = scenario(args, interfaces, failure_ratio, webex_url, workdir)
+                elapsed = time.perf_counter() - start
+            finally:
+                shutil.rmtree(workdir, ignore_errors=True)
+            results.append({'interfaces': interfaces, 'failure_ratio': failure_ratio, 'repeat': args.repeat,
+                            'seconds': elapsed, 'stages': stages})
+            print(f"{ interfaces:>6} interfaces { failure_ratio:>5.0%} failing  { elapsed:8.2f}s  "
+                  + '  '.join(f"{ stage } { stages[stage]['seconds']:.2f}" for stage in stages))
+    webex.shutdown()
+
+    with open(args.output, 'w') as f:
+        json.dump({
+            'revision': revision(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'json_backend': serializer.backend.name,
+            'snapshot_format': args.snapshot_format,
+            'targeted': args.targeted,
+            'artifacts': args.artifacts,
+            'results': results,
+        }, f, indent=4)
+    print(f"Wrote { args.output }")
+
+if __name__ == '__main__':
+    main()
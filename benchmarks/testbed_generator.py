@@ -0,0 +1,48 @@
+"""Testbed YAML with N devices served by fake_restconf.py
+
+    python benchmarks/testbed_generator.py --devices 1000 --output testbed_1000.yaml
+
+Device i gets its own loopback address 127.x.y.z so the fake server can
+tell the devices apart.
+"""
+import argparse
+import ipaddress
+import yaml
+
+FIRST = ipaddress.ip_address('127.0.1.1')
+
+def testbed(devices, port=8443, username='developer', password='developer'):
+    """Testbed dictionary for the given number of fake devices"""
+    topology = {'devices': {}}
+    for index in range(devices):
+        ip = FIRST + index
+        topology['devices'][f"fake-{ index + 1:04d}"] = {
+            'alias': f"fake-{ index + 1:04d}",
+            'type': 'router',
+            'os': 'iosxe',
+            'platform': 'csr1000v',
+            'connections': {
+                'rest': {
+                    'class': 'rest.connector.Rest',
+                    'ip': str(ip),
+                    'port': port,
+                    'protocol': 'http',
+                    'credentials': {'rest': {'username': username, 'password': password}},
+                },
+            },
+        }
+    return topology
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--devices', type=int, default=10)
+    parser.add_argument('--port', type=int, default=8443)
+    parser.add_argument('--output', default='testbed_fake.yaml')
+    args = parser.parse_args()
+    with open(args.output, 'w') as f:
+        f.write('---\n\n')
+        yaml.safe_dump(testbed(args.devices, args.port), f, default_flow_style=False, sort_keys=False)
+    print(f"Wrote { args.devices } devices to { args.output }")
+
+if __name__ == '__main__':
+    main()
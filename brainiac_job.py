@@ -1,8 +1,71 @@
 import os
+import sys
+import shutil
+import argparse
+import tempfile
+from pyats.easypy import Task
 from genie.testbed import load
 
+# The helper modules live next to the job file
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import metrics
+import snapshot
+import report
+import webex
+import llm
+import chatgpt
+import postprocess
+from checks import MODELS
+from cache import ANSWER_DIR, ANSWER_TTL, ANSWER_CACHE_SIZE
+
+# ----------------
+# Job arguments
+# ----------------
+parser = argparse.ArgumentParser()
+parser.add_argument('--replay', nargs='?', const='JSON', default=None, metavar='DIRECTORY',
+                    help='Run the checks against the snapshots saved in DIRECTORY (JSON/ by default) instead of the devices')
+parser.add_argument('--notify', action='store_true',
+                    help='Ask ChatGPT and post to WebEx about replayed failures too, which replay skips otherwise')
+parser.add_argument('--shards', type=int, default=os.cpu_count() or 1,
+                    help='Split the testbed across this many parallel tasks (default: one per CPU)')
+parser.add_argument('--streaming', action='store_true',
+                    help='Spool RESTCONF bodies to disk and evaluate one interface at a time, for very large interface models')
+parser.add_argument('--full-tree', dest='targeted', action='store_false',
+                    help='Ask RESTCONF for the whole model instead of only the leaves the checks read')
+parser.add_argument('--trace-memory', action='store_true',
+                    help='Report the peak memory of each section instead of the process peak RSS')
+parser.add_argument('--snapshot-format', choices=list(snapshot.EXTENSIONS), default='json',
+                    help='Write the JSON/ snapshots as pretty JSON or zstd compressed msgpack (default: json)')
+parser.add_argument('--artifacts', choices=report.ARTIFACTS, default='failed',
+                    help='Which checks save their table as SVG in Test Results/ (default: failed)')
+parser.add_argument('--report-layout', choices=report.LAYOUTS, default='tests',
+                    help='One SVG per test, or one HTML report per device or per run with an index')
+parser.add_argument('--webex-digest', choices=webex.GROUPS, default='device',
+                    help='Send the failures to WebEx as one message per device or per run (default: device)')
+parser.add_argument('--chatgpt-mode', choices=chatgpt.MODES, default='questions',
+                    help='Ask ChatGPT three questions per failed test, or one prompt covering every failure of a device')
+parser.add_argument('--llm-provider', choices=llm.PROVIDERS, default=None,
+                    help='Where the ChatGPT answers come from: openai, a local stub, or recorded and replayed (default: LLM_PROVIDER or openai)')
+parser.add_argument('--llm-recordings', default=llm.RECORDINGS_DIR, metavar='DIRECTORY',
+                    help='Directory the record provider writes and the replay provider reads (default: llm_recordings)')
+parser.add_argument('--png-workers', type=int, default=2,
+                    help='Processes rasterizing the PNGs uploaded to WebEx, 0 rasterizes inline (default: 2)')
+parser.add_argument('--chatgpt-workers', type=int, default=chatgpt.MAX_CONCURRENCY,
+                    help='ChatGPT questions in flight at once (default: 4)')
+parser.add_argument('--chatgpt-cache', default=ANSWER_DIR, metavar='DIRECTORY',
+                    help='Directory caching the ChatGPT answers across runs (default: chatgpt_cache)')
+parser.add_argument('--no-chatgpt-cache', dest='chatgpt_cache', action='store_const', const=None,
+                    help='Always ask ChatGPT instead of reading cached answers')
+parser.add_argument('--chatgpt-cache-ttl', type=int, default=ANSWER_TTL,
+                    help='Seconds a cached ChatGPT answer stays valid (default: a week)')
+parser.add_argument('--chatgpt-cache-size', type=int, default=ANSWER_CACHE_SIZE,
+                    help='Bytes of ChatGPT answers kept on disk (default: 16 MiB)')
+
 def main(runtime):
 
+    # easypy hands its unknown arguments to the job
+    args, _ = parser.parse_known_args()
+
     # ----------------
     # Load the testbed
     # ----------------
@@ -18,5 +81,56 @@ def main(runtime):
     # Find the location of the script in relation to the job file
     testscript = os.path.join(os.path.dirname(__file__), 'brainiac.py')
 
-    # run script
-    runtime.tasks.run(testscript=testscript, testbed=testbed)
\ No newline at end of file
+    # RESTCONF responses are cached per run so every task reuses them, outside
+    # runtime.directory so the archive does not keep a second copy of every payload
+    cache_dir = tempfile.mkdtemp(prefix='restconf_cache_')
+
+    # Every task dumps its section and external call metrics here
+    metrics_dir = os.path.join(runtime.directory, 'metrics')
+
+    # and its failures for the post-run stage
+    events_dir = os.path.join(runtime.directory, 'events')
+
+    # and the checks of the consolidated report, written once for the whole run
+    report_dir = os.path.join(runtime.directory, 'report')
+
+    # ----------------
+    # Shard the devices across parallel tasks
+    # ----------------
+    device_names = list(testbed.devices)
+    if args.replay:
+        device_names += snapshot.untracked(testbed, args.replay, MODELS)
+    shards = max(1, min(args.shards, len(device_names)))
+
+    # run script, every task in its own process and all of them in the one job report
+    tasks = []
+    for index in range(shards):
+        tasks.append(Task(testscript=testscript, runtime=runtime, taskid=f'brainiac-{ index + 1 }',
+                          testbed=testbed, devices=device_names[index::shards], cache_dir=cache_dir,
+                          replay=args.replay, streaming=args.streaming, targeted=args.targeted,
+                          trace_memory=args.trace_memory, snapshot_format=args.snapshot_format, artifacts=args.artifacts, report_layout=args.report_layout,
+                          events_dir=events_dir, report_dir=report_dir, metrics_dir=metrics_dir))
+    try:
+        for task in tasks:
+            task.start()
+        for task in tasks:
+            task.wait()
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+    # ChatGPT, gTTS and WebEx for the failures of every task, off the verdict path
+    # Replayed failures are old news, they stay off the network unless asked for
+    if not args.replay or args.notify:
+        postprocess.run(events_dir, webex_digest=args.webex_digest, png_workers=args.png_workers,
+                        chatgpt_workers=args.chatgpt_workers, chatgpt_cache=args.chatgpt_cache,
+                        chatgpt_cache_ttl=args.chatgpt_cache_ttl, chatgpt_cache_size=args.chatgpt_cache_size,
+                        chatgpt_mode=args.chatgpt_mode, llm_provider=args.llm_provider,
+                        llm_recordings=args.llm_recordings)
+    metrics.dump(metrics_dir)
+
+    # The documents of every task, linked from Test Results/index.html
+    if args.report_layout != 'tests':
+        report.Consolidated.load(report_dir, args.report_layout).write()
+
+    # Merge them into metrics.json and Prometheus metrics.prom in the archive
+    metrics.export(metrics_dir, runtime.directory)
@@ -0,0 +1,223 @@
+"""Per-run RESTCONF response cache
+
+IOS-XE RESTCONF is slow and expensive on the device control plane, so each
+payload is fetched once per device and reused by every testcase, repeated
+job and extra testscript of the same easypy run.  Responses are kept in
+memory and, when a directory is given, on disk so that the separate task
+processes of one run share them; with a directory the disk copy is the
+only one, so a payload is not held for the whole run once its checks are
+done.  Entries expire after ttl seconds.
+
+ChatGPT answers are cached across runs by AnswerCache, content addressed by
+the model and messages asked, so the same static questions about a failed
+check are answered locally on every device and every later run.
+"""
+import os
+import json
+import time
+import hashlib
+import threading
+from urllib.parse import quote
+import serializer
+
+# Seconds a cached response stays valid
+DEFAULT_TTL = 300
+
+def write_atomic(filename, data):
+    """Write bytes, or an iterable of byte chunks, to a temporary file renamed over filename
+
+    Other threads and processes see the old file or the whole new one, never a partial write.
+    """
+    os.makedirs(os.path.dirname(filename) or '.', exist_ok=True)
+    tmp = f"{ filename }.{ os.getpid() }.{ threading.get_ident() }.tmp"
+    with open(tmp, 'wb') as f:
+        for chunk in (data,) if isinstance(data, bytes) else data:
+            f.write(chunk)
+    os.replace(tmp, filename)
+
+class ResponseCache:
+    """Cache of decoded RESTCONF payloads keyed by device name and path"""
+
+    def __init__(self, directory=None, ttl=DEFAULT_TTL):
+        self.directory = directory
+        self.ttl = ttl
+        self.entries = {}
+        self.lock = threading.Lock()
+
+    def filename(self, device, path):
+        # Query strings such as fields= get too long for a file name, hash them
+        resource, _, query = path.partition('?')
+        digest = hashlib.sha1(query.encode()).hexdigest()[:12]
+        return os.path.join(self.directory, quote(device, safe=''), f"{ quote(resource, safe='') }-{ digest }.json")
+
+    def get(self, device, path):
+        """The cached payload, or None when missing or expired"""
+        now = time.time()
+        with self.lock:
+            entry = self.entries.get((device, path))
+        if entry and now - entry[0] < self.ttl:
+            return entry[1]
+        if self.directory:
+            filename = self.filename(device, path)
+            try:
+                stored = os.path.getmtime(filename)
+                if now - stored < self.ttl:
+                    with open(filename, 'rb') as f:
+                        return serializer.loads(f.read())
+            except (OSError, ValueError):
+                pass
+        return None
+
+    def put(self, device, path, payload):
+        if self.directory:
+            write_atomic(self.filename(device, path), serializer.dumps(payload))
+            return
+        with self.lock:
+            self.entries[(device, path)] = (time.time(), payload)
+
+    def locate(self, device, path):
+        """File name of a fresh response on disk, or None"""
+        if not self.directory:
+            return None
+        filename = self.filename(device, path)
+        try:
+            if time.time() - os.path.getmtime(filename) < self.ttl:
+                return filename
+        except OSError:
+            pass
+        return None
+
+    def spool(self, device, path, chunks):
+        """Write a raw response body to disk without decoding it, returns the file name"""
+        filename = self.filename(device, path)
+        write_atomic(filename, chunks)
+        return filename
+
+    def invalidate(self, device=None, path=None):
+        """Drop cached responses for one device / path, or everything by default
+
+        A path without a query string also drops its fields= variants.
+        """
+        with self.lock:
+            for key in list(self.entries):
+                if (device is None or key[0] == device) and (path is None or path in (key[1], key[1].partition('?')[0])):
+                    del self.entries[key]
+        if not self.directory or not os.path.isdir(self.directory):
+            return
+        devices = [quote(device, safe='')] if device else os.listdir(self.directory)
+        for name in devices:
+            folder = os.path.join(self.directory, name)
+            if not os.path.isdir(folder):
+                continue
+            for entry in os.listdir(folder):
+                if path is None:
+                    matches = True
+                elif '?' in path:
+                    matches = entry == os.path.basename(self.filename(name, path))
+                else:
+                    matches = entry.rpartition('-')[0] == quote(path, safe='')
+                if matches:
+                    try:
+                        os.remove(os.path.join(folder, entry))
+                    except OSError:
+                        pass
+
+# ----------------
+# ChatGPT answers
+# ----------------
+ANSWER_DIR = 'chatgpt_cache'
+
+# The questions are static, so answers stay valid for a week
+ANSWER_TTL = 7 * 24 * 3600
+
+# Least recently used answers are evicted beyond this many bytes on disk
+ANSWER_CACHE_SIZE = 16 << 20
+
+class AnswerCache:
+    """Chat completions on disk, keyed by a hash of the model and messages
+
+    Files hold the creation time the TTL counts from; their mtime is bumped
+    on every hit so eviction drops the least recently used first.  Every
+    task process of every run shares the directory.
+    """
+
+    def __init__(self, directory=ANSWER_DIR, ttl=ANSWER_TTL, max_bytes=ANSWER_CACHE_SIZE):
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.entries = {}
+        self.size = None
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def key(model, messages):
+        request = json.dumps({'model': model, 'messages': messages}, sort_keys=True, separators=(',', ':'))
+        return hashlib.sha256(request.encode()).hexdigest()
+
+    def filename(self, key):
+        return os.path.join(self.directory, key[:2], f"{ key }.json")
+
+    def get(self, model, messages):
+        """The cached answer, or None when missing or expired"""
+        key = self.key(model, messages)
+        now = time.time()
+        with self.lock:
+            entry = self.entries.get(key)
+        if entry and now - entry[0] < self.ttl:
+            return entry[1]
+        filename = self.filename(key)
+        try:
+            with open(filename, 'rb') as f:
+                stored = serializer.loads(f.read())
+            if now - stored['created'] >= self.ttl:
+                return None
+            os.utime(filename)
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        with self.lock:
+            self.entries[key] = (stored['created'], stored['answer'])
+        return stored['answer']
+
+    def put(self, model, messages, answer):
+        key = self.key(model, messages)
+        created = time.time()
+        with self.lock:
+            self.entries[key] = (created, answer)
+        data = serializer.dumps({'model': model, 'created': created, 'answer': answer})
+        write_atomic(self.filename(key), data)
+        with self.lock:
+            if self.size is not None:
+                self.size += len(data)
+            full = self.size is None or self.size > self.max_bytes
+        if full:
+            self.evict()
+
+    def evict(self):
+        """Drop expired answers, then the least recently used until the cache fits max_bytes"""
+        now = time.time()
+        files = []
+        for folder, _, names in os.walk(self.directory):
+            for name in names:
+                if not name.endswith('.json'):
+                    continue
+                filename = os.path.join(folder, name)
+                try:
+                    stat = os.stat(filename)
+                except OSError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, filename))
+        files.sort()
+        size = sum(entry[1] for entry in files)
+        for used, length, filename in files:
+            # mtime is at least the creation time, so anything unused for a TTL has expired
+            if size <= self.max_bytes and now - used < self.ttl:
+                break
+            try:
+                os.remove(filename)
+            except OSError:
+                pass
+            size -= length
+            with self.lock:
+                self.entries.pop(os.path.basename(filename)[:-len('.json')], None)
+        with self.lock:
+            self.size = size
@@ -0,0 +1,116 @@
+"""ChatGPT questions about the failed checks, asked concurrently
+
+A failed check asks three questions (what is it, which show commands, how to
+fix it).  Asked back to back they cost three round trips, so ask() hands
+them to a thread pool shared by every failure of the run, whose size is the
+limit of calls in flight.  When the provider rate limits one call, every
+worker holds off until the delay it asked for has passed, then the call is
+retried.  Answers found in the AnswerCache never reach OpenAI.  The
+completions come from an llm provider: OpenAI, or offline the stub and
+recordings.
+
+The device mode asks one question per device instead, diagnose() lists every
+failed check with its interfaces and counters so a single answer covers them
+all and can relate them to each other.
+"""
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import llm
+import metrics
+import httpclient
+
+MODEL = "gpt-3.5-turbo"
+
+# questions asks the questions of every failed check, device one prompt per device
+MODES = ('questions', 'device')
+
+# Calls to the provider in flight at once
+MAX_CONCURRENCY = 4
+
+# Rate limited calls are retried this many times, waiting Retry-After seconds
+# or BACKOFF doubled on every attempt
+MAX_RETRIES = 5
+BACKOFF = 2
+
+# Failing interfaces listed per check in the device prompt, the rest are counted
+MAX_INTERFACES = 10
+
+def messages(question):
+    return [
+            {"role": "system", "content": "You are a chatbot"},
+            {"role": "user", "content": question},
+        ]
+
+def diagnose(alias, failures, max_interfaces=MAX_INTERFACES):
+    """One prompt covering the failures of a device, a list of (check, {interface: value})
+
+    Each check lists its first max_interfaces failing interfaces and counts
+    the others, so a check failing on every port keeps the prompt short.
+    """
+    lines = [f"The Cisco IOS XE device { alias } failed these interface checks, with the failing interfaces and their values:"]
+    for check, interfaces in failures:
+        listed = ', '.join(f'{ interface } ({ value })' for interface, value in list(interfaces.items())[:max_interfaces])
+        if len(interfaces) > max_interfaces:
+            listed += f" and { len(interfaces) - max_interfaces } more interfaces"
+        lines.append(f"- { check.title }: { listed }")
+    lines.append("For each failure explain what it means, which Cisco show commands investigate it and how to fix it. "
+                 "Then point out the failures that are likely related, such as interfaces failing several checks, "
+                 "and their most probable common cause.")
+    return '\n'.join(lines)
+
+class ChatGPT:
+    """Thread pool asking the provider, with one rate limit back-off for every device"""
+
+    def __init__(self, provider, workers=MAX_CONCURRENCY, cache=None, model=MODEL):
+        self.provider = provider
+        self.pool = ThreadPoolExecutor(workers, thread_name_prefix='chatgpt')
+        # Only real answers are cached, stub and replayed ones are local anyway
+        self.cache = cache if provider.cached else None
+        self.model = model
+        self.resume_at = 0.0
+        self.lock = threading.Lock()
+
+    def hold(self):
+        """Wait out a rate limit hit by any worker"""
+        with self.lock:
+            delay = self.resume_at - time.time()
+        if delay > 0:
+            time.sleep(delay)
+
+    def back_off(self, delay):
+        with self.lock:
+            self.resume_at = max(self.resume_at, time.time() + delay)
+
+    def complete(self, question, device=None, test=None):
+        """The answer to one question, from the cache when it is there"""
+        asked = messages(question)
+        if self.cache:
+            result = self.cache.get(self.model, asked)
+            if result is not None:
+                return result
+
+        def attempt():
+            self.hold()
+            with metrics.measure('call', self.provider.name, device, test) as record:
+                result = self.provider.complete(self.model, asked, record)
+                record['bytes'] = len(result.encode())
+            return result
+
+        # A rate limit holds off every question, not only this one
+        result = httpclient.retry(attempt, lambda outcome: isinstance(outcome, llm.RateLimited), MAX_RETRIES, BACKOFF,
+                                  lambda e: f"{ self.provider.name } rate limited { device }, every question holds off", self.back_off)
+        if self.cache:
+            self.cache.put(self.model, asked, result)
+        return result
+
+    def submit(self, questions, device=None, test=None):
+        """Futures of the answers, in the order of the questions"""
+        return [self.pool.submit(self.complete, question, device, test) for question in questions]
+
+    def ask(self, questions, device=None, test=None):
+        """Answers in the order of the questions, which are asked concurrently"""
+        return [future.result() for future in self.submit(questions, device, test)]
+
+    def close(self):
+        self.pool.shutdown(wait=True)
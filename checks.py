@@ -0,0 +1,206 @@
+"""Declarative registry of the interface checks
+
+Each row describes one aetest test section: the YANG model it reads, the
+engine rule (JSON path, comparator and threshold) and the strings used for
+its table, artifacts and notifications.  brainiac.py generates the test
+sections from these rows, so adding a counter means adding one row.
+"""
+from collections import namedtuple
+from engine import CounterRule, MatchRule, AdminOperRule, DescriptionRule
+
+# ----------------
+# One check
+#   uid       - aetest section uid
+#   rule      - engine rule evaluated against every interface
+#   title     - Rich table title, also the SVG / PNG / MP3 file name stem
+#   columns   - the columns between Interface and Passed/Failed
+#   alert     - WebEx text posted with the table
+#   failed    - aetest message when any interface fails
+#   passed    - aetest message when every interface passes
+#   spoken    - gTTS / WebEx text for a failed interface, formatted with
+#               alias, intf and the row cells as {0}, {1}
+#   questions - what we ask ChatGPT when the check fails, None to skip
+# ----------------
+Check = namedtuple('Check', ['uid', 'rule', 'title', 'columns', 'alert', 'failed', 'passed', 'spoken', 'questions'])
+
+# ----------------
+# A YANG model fetched over RESTCONF
+#   path     - RESTCONF data resource, also the top level key of the payload
+#   snapshot - JSON/ snapshot file name stem
+#   checks   - every check evaluated against the interface list of the model
+# ----------------
+class Model(namedtuple('Model', ['path', 'snapshot', 'checks'])):
+
+    @property
+    def rules(self):
+        return [check.rule for check in self.checks]
+
+    @property
+    def uids(self):
+        return [check.uid for check in self.checks]
+
+    @property
+    def fields(self):
+        """RESTCONF fields= expression selecting only the leaves the checks read"""
+        leaves = ['name']
+        for rule in self.rules:
+            for leaf in rule.leaves:
+                leaf = '/'.join(leaf)
+                if leaf not in leaves:
+                    leaves.append(leaf)
+        return f"interface({ ';'.join(leaves) })"
+
+def ask(topic):
+    """The three questions we ask ChatGPT about a failed counter"""
+    return (f"What is a Cisco Interface { topic }?",
+            f"What Cisco show commands are related to { topic }?",
+            f"How do we fix a Cisco Interface { topic }?")
+
+# ----------------
+# Check factories
+# ----------------
+def counter(label, uid, name, path, threshold=0, requires=None, optional=False, topic=None):
+    """A counter that must not cross the threshold
+
+    optional only reports interfaces that carry the counter leaf at all.
+    """
+    if optional:
+        requires = path
+    return Check(
+        uid=uid,
+        rule=CounterRule(uid, path, threshold, requires),
+        title=f"{ label } Interface { name }",
+        columns=(f"{ name } Threshold", name),
+        alert=f"has Interface { name }",
+        failed=f"Some interfaces have { name.lower() }",
+        passed=f"No interfaces have { name.lower() }",
+        spoken=f"The Device {{alias}} Interface {{intf}} has crossed the threshold of {{0}} for { name.lower() } with {{1}} { name.lower() }",
+        questions=ask(topic) if topic else None)
+
+def admin_oper(label, uid, path, requires=None, expected=None, questions=None):
+    """The oper status must match the admin status"""
+    return Check(
+        uid=uid,
+        rule=AdminOperRule(uid, path, requires, expected),
+        title=f"{ label } Interfaces Admin Status Matches Oper Status",
+        columns=("Admin Status", "Oper Status"),
+        alert="has Interfaces with Admin and Oper Status mismatches",
+        failed="Some interfaces are admin / oper state mismatch",
+        passed="All interfaces admin / oper state match",
+        spoken="The Device {alias} on Interface {intf} is admin {0} but Oper {1}",
+        questions=questions)
+
+def description(label, uid, path, requires=None, questions=None):
+    """Every interface must have a description"""
+    return Check(
+        uid=uid,
+        rule=DescriptionRule(uid, path, requires),
+        title=f"{ label } Interfaces Have Descriptions",
+        columns=("Description",),
+        alert="Has Interfaces without Descriptions",
+        failed="Some interfaces have no description",
+        passed="All interfaces have descriptions",
+        spoken="The Device {alias} Interface {intf} has no description",
+        questions=questions)
+
+# ----------------
+# openconfig-interfaces:interfaces
+# ----------------
+OPEN_CONFIG = "Open Config"
+ETHERNET = ('openconfig-if-ethernet:ethernet',)
+ETHERNET_COUNTERS = ETHERNET + ('state', 'counters')
+STATE_COUNTERS = ('state', 'counters')
+
+OPENCONFIG_CHECKS = [
+    counter(OPEN_CONFIG, 'test_interface_input_crc_errors', "Input CRC Errors", ETHERNET_COUNTERS + ('in-crc-errors',), requires=ETHERNET, topic="Input CRC Error"),
+    counter(OPEN_CONFIG, 'test_interface_input_fragment_frames', "Input Fragment Frames", ETHERNET_COUNTERS + ('in-fragment-frames',), requires=ETHERNET, topic="Input Fragment Frame"),
+    counter(OPEN_CONFIG, 'test_interface_input_jabber_frames', "Input Jabber Frames", ETHERNET_COUNTERS + ('in-jabber-frames',), requires=ETHERNET, topic="Input Jabber Frame"),
+    counter(OPEN_CONFIG, 'test_interface_input_mac_pause_frames', "Input MAC Pause Frames", ETHERNET_COUNTERS + ('in-mac-pause-frames',), requires=ETHERNET, topic="Input MAC Pause Frame"),
+    counter(OPEN_CONFIG, 'test_interface_input_oversize_frames', "Input Oversize Frames", ETHERNET_COUNTERS + ('in-oversize-frames',), requires=ETHERNET, topic="Input Oversize Frame"),
+    counter(OPEN_CONFIG, 'test_interface_output_pause_frames', "Output MAC Pause Frames", ETHERNET_COUNTERS + ('out-mac-pause-frames',), requires=ETHERNET, topic="Output MAC Pause Frame"),
+    counter(OPEN_CONFIG, 'test_interface_input_discards', "Input Discards", STATE_COUNTERS + ('in-discards',), topic="Input Discard"),
+    counter(OPEN_CONFIG, 'test_interface_input_errors', "Input Errors", STATE_COUNTERS + ('in-errors',), topic="Input Error"),
+    counter(OPEN_CONFIG, 'test_interface_input_fcs_errors', "Input FCS Errors", STATE_COUNTERS + ('in-fcs-errors',), topic="Input FCS Error"),
+    counter(OPEN_CONFIG, 'test_interface_input_unknown_protocols', "Input Unknown Protocols", STATE_COUNTERS + ('in-unknown-protos',), topic="Input Unknown Protocol"),
+    counter(OPEN_CONFIG, 'test_interface_output_discards', "Output Discards", STATE_COUNTERS + ('out-discards',), topic="Output Discard"),
+    counter(OPEN_CONFIG, 'test_interface_output_errors', "Output Errors", STATE_COUNTERS + ('out-errors',), topic="Output Error"),
+    Check(
+        uid='test_interface_full_duplex',
+        rule=MatchRule('test_interface_full_duplex', ETHERNET + ('state', 'negotiated-duplex-mode'), "FULL", requires=ETHERNET),
+        title=f"{ OPEN_CONFIG } Interfaces Are Full Duplex",
+        columns=("Duplex Mode",),
+        alert="has Interfaces that are not Full Duplex",
+        failed="Some interfaces are not full duplex",
+        passed="All interfaces are full duplex",
+        spoken="The Device {alias} Interface {intf} is duplex {0}",
+        questions=("What is Full Duplex on an Interface?",
+                   "What Cisco show commands are related to duplex?",
+                   "How do we fix a half duplex interface?")),
+    admin_oper(OPEN_CONFIG, 'test_interface_admin_oper_status', ('state',), requires=('state', 'admin-status'),
+               questions=("What is Admin Status and Oper Status on an Interface?",
+                          "What Cisco show commands are related to admin and oper status?",
+                          "How do we fix a mismatched admin and oper status on an interface?")),
+    description(OPEN_CONFIG, 'test_interface_description', ('config', 'description'),
+                questions=("What is a Cisco Network Interface Description?",
+                           "What Cisco show commands are related to interface description?",
+                           "How do we add a description to a Cisco network interface?")),
+]
+
+# ----------------
+# Cisco-IOS-XE-interfaces-oper:interfaces
+# ----------------
+IOS_XE = "Cisco IOS-XE"
+STATISTICS = ('statistics',)
+V4_STATS = ('v4-protocol-stats',)
+V6_STATS = ('v6-protocol-stats',)
+
+IOS_XE_CHECKS = [
+    description(IOS_XE, 'test_interface_description', ('description',), requires=('description',)),
+    counter(IOS_XE, 'test_interface_input_crc_errors', "Input CRC Errors", STATISTICS + ('in-crc-errors',), optional=True),
+    counter(IOS_XE, 'test_interface_input_discards', "Input Discards", STATISTICS + ('in-discards',), optional=True),
+    counter(IOS_XE, 'test_interface_input_discards_64', "Input Discards 64", STATISTICS + ('in-discards-64',), optional=True),
+    counter(IOS_XE, 'test_interface_input_errors', "Input Errors", STATISTICS + ('in-errors',), optional=True),
+    counter(IOS_XE, 'test_interface_input_errors_64', "Input Errors 64", STATISTICS + ('in-errors-64',), optional=True),
+    counter(IOS_XE, 'test_interface_input_unknown_protocols', "Input Unknown Protocols", STATISTICS + ('in-unknown-protos',), optional=True),
+    counter(IOS_XE, 'test_interface_input_unknown_protocols_64', "Input Unknown Protocols 64", STATISTICS + ('in-unknown-protos-64',), optional=True),
+    counter(IOS_XE, 'test_interface_number_flaps', "Flaps", STATISTICS + ('num-flaps',), optional=True),
+    counter(IOS_XE, 'test_output_discards', "Output Discards", STATISTICS + ('out-discards',), optional=True),
+    counter(IOS_XE, 'test_output_errors', "Output Errors", STATISTICS + ('out-errors',), optional=True),
+    counter(IOS_XE, 'test_v4_protocol_input_discarded_packets', "v4 Protocol Input Discarded Packets", V4_STATS + ('in-discarded-pkts',), optional=True),
+    counter(IOS_XE, 'test_v4_protocol_input_error_packets', "v4 Protocol Input Error Packets", V4_STATS + ('in-error-pkts',), optional=True),
+    counter(IOS_XE, 'test_v4_protocol_output_discarded_packets', "v4 Protocol Output Discarded Packets", V4_STATS + ('out-discarded-pkts',), optional=True),
+    counter(IOS_XE, 'test_v4_protocol_output_error_packets', "v4 Protocol Output Error Packets", V4_STATS + ('out-error-pkts',), optional=True),
+    counter(IOS_XE, 'test_v6_protocol_input_discarded_packets', "v6 Protocol Input Discarded Packets", V6_STATS + ('in-discarded-pkts',), optional=True),
+    counter(IOS_XE, 'test_v6_protocol_input_error_packets', "v6 Protocol Input Error Packets", V6_STATS + ('in-error-pkts',), optional=True),
+    counter(IOS_XE, 'test_v6_protocol_output_discarded_packets', "v6 Protocol Output Discarded Packets", V6_STATS + ('out-discarded-pkts',), optional=True),
+    counter(IOS_XE, 'test_v6_protocol_output_error_packets', "v6 Protocol Output Error Packets", V6_STATS + ('out-error-pkts',), optional=True),
+    admin_oper(IOS_XE, 'test_interface_admin_oper_status', (), expected={'if-state-up': 'if-oper-state-ready'}),
+]
+
+# ----------------
+# ietf-interfaces:interfaces and ietf-interfaces:interfaces-state
+# ----------------
+IETF = "IETF"
+
+IETF_CHECKS = [
+    description(IETF, 'test_interface_description', ('description',)),
+]
+
+IETF_STATE_CHECKS = [
+    counter(IETF, 'test_input_discards', "Input Discards", STATISTICS + ('in-discards',), optional=True),
+    counter(IETF, 'test_input_errors', "Input Errors", STATISTICS + ('in-errors',), optional=True),
+    counter(IETF, 'test_input_unknown_protocols', "Input Unknown Protocols", STATISTICS + ('in-unknown-protos',), optional=True),
+    counter(IETF, 'test_output_discards', "Output Discards", STATISTICS + ('out-discards',), optional=True),
+    counter(IETF, 'test_output_errors', "Output Errors", STATISTICS + ('out-errors',), optional=True),
+    admin_oper(IETF, 'test_interface_admin_oper_status', ()),
+]
+
+# ----------------
+# Models
+# ----------------
+OPENCONFIG = Model('openconfig-interfaces:interfaces', 'OpenConfig_Interfaces', OPENCONFIG_CHECKS)
+IOS_XE_OPER = Model('Cisco-IOS-XE-interfaces-oper:interfaces', 'Cisco_IOS_XE_Interfaces_Oper', IOS_XE_CHECKS)
+IETF_INTERFACES = Model('ietf-interfaces:interfaces', 'IETF_Interfaces', IETF_CHECKS)
+IETF_INTERFACES_STATE = Model('ietf-interfaces:interfaces-state', 'IETF_Interfaces State', IETF_STATE_CHECKS)
+
+MODELS = [OPENCONFIG, IOS_XE_OPER, IETF_INTERFACES, IETF_INTERFACES_STATE]
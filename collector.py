@@ -0,0 +1,158 @@
+"""Concurrent RESTCONF collection for every device in the testbed
+
+common_setup fetches all YANG models for all devices up front with a
+bounded thread pool, so wall clock time is bounded by the slowest devices
+instead of the sum of every device's RESTCONF latency.  The testcases then
+read their payloads from the prefetched store.
+"""
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from stream import CHUNK_SIZE
+import serializer
+import metrics
+
+log = logging.getLogger(__name__)
+
+# Upper bound on devices polled at the same time
+MAX_WORKERS = 32
+
+# Devices whose RESTCONF agent rejected a fields= query, pulled in full from then on
+UNFILTERED = set()
+
+# Replies rest.connector accepts by default
+ACCEPTED = (200, 204)
+
+# Replies of agents that do not support the fields= query parameter
+REJECTED = (400, 501)
+
+class MissingContainer(ValueError):
+    """The reply is empty or does not hold the requested container"""
+
+class FieldsRejected(ValueError):
+    """The device answered a fields= query with one of the REJECTED codes"""
+
+def rejected(error):
+    """Whether a fields= request failed because the device does not support the query
+
+    Timeouts, resets and other errors are not the query's fault and are
+    raised as they would be without fields=.
+    """
+    return isinstance(error, (MissingContainer, FieldsRejected))
+
+def get(device, path, resource, fields=None):
+    """GET one RESTCONF data resource, FieldsRejected when the device refuses fields=
+
+    rest.connector raises a bare RequestException naming the code for any
+    reply outside expected_status_codes, so the REJECTED codes of a fields=
+    query are accepted there and checked here.
+    """
+    with metrics.measure('call', 'restconf', device.alias, path) as record:
+        if fields:
+            response = device.rest.get(f"/restconf/data/{ resource }", expected_status_codes=ACCEPTED + REJECTED)
+        else:
+            response = device.rest.get(f"/restconf/data/{ resource }")
+        record['bytes'] = len(response.content)
+    if fields and response.status_code in REJECTED:
+        raise FieldsRejected(f"'{ response.status_code }' result code has been returned")
+    return response
+
+def query(path, fields=None):
+    """RESTCONF data resource, narrowed to the given fields= expression"""
+    if fields:
+        return f"{ path }?fields={ fields }"
+    return path
+
+def fetch(device, path, cache=None, fields=None):
+    """GET one RESTCONF data resource and decode the JSON payload
+
+    fields narrows the reply to the leaves the checks read; when the device
+    rejects the query the full tree is pulled instead.  With a ResponseCache
+    the device is only asked when no fresh copy of the payload is cached for
+    this run.
+    """
+    if device.name in UNFILTERED:
+        fields = None
+    resource = query(path, fields)
+    if cache is not None:
+        payload = cache.get(device.name, resource)
+        if payload is not None:
+            log.debug(f"Using cached { resource } for { device.name }")
+            return payload
+    try:
+        response = get(device, path, resource, fields)
+        if not response.content:
+            raise MissingContainer(f"empty reply, no { path } container")
+        payload = serializer.loads(response.content)
+        if path not in payload:
+            raise MissingContainer(f"reply has no { path } container")
+    except Exception as e:
+        if not fields or not rejected(e):
+            raise
+        log.info(f"{ device.name } rejected fields= on { path } ({ e }), pulling the full tree")
+        UNFILTERED.add(device.name)
+        return fetch(device, path, cache)
+    if cache is not None:
+        cache.put(device.name, resource, payload)
+    return payload
+
+def spool(device, path, cache, fields=None):
+    """GET one RESTCONF data resource into the cache directory undecoded
+
+    Used by the streaming mode, which then reads the interface list back
+    from the returned file one element at a time.  cache must have a
+    directory.
+    """
+    if device.name in UNFILTERED:
+        fields = None
+    resource = query(path, fields)
+    filename = cache.locate(device.name, resource)
+    if filename:
+        log.debug(f"Using cached { resource } for { device.name }")
+        return filename
+    try:
+        response = get(device, path, resource, fields)
+        if f'"{ path }"'.encode() not in response.content[:len(path) + 64]:
+            raise MissingContainer(f"reply has no { path } container")
+    except Exception as e:
+        if not fields or not rejected(e):
+            raise
+        log.info(f"{ device.name } rejected fields= on { path } ({ e }), pulling the full tree")
+        UNFILTERED.add(device.name)
+        return spool(device, path, cache)
+    return cache.spool(device.name, resource, response.iter_content(CHUNK_SIZE))
+
+def fetch_device(device, models, cache=None, targeted=True, streaming=False):
+    """Fetch every model from one device, one request at a time
+
+    In streaming mode each model maps to the file its body was spooled to
+    instead of the decoded payload.
+    """
+    payloads = {}
+    for model in models:
+        fields = model.fields if targeted else None
+        if streaming:
+            payloads[model.path] = spool(device, model.path, cache, fields)
+        else:
+            payloads[model.path] = fetch(device, model.path, cache, fields)
+    return payloads
+
+def collect(devices, models, max_workers=MAX_WORKERS, cache=None, targeted=True, streaming=False):
+    """Fetch every model from every device concurrently
+
+    Devices are polled in parallel, each device's resources one after the
+    other so a single RESTCONF agent never sees more than one request from
+    us at a time.  Returns {device name: {model path: payload}}; devices that
+    failed are logged and left out so the testcases can retry them live.
+    """
+    store = {}
+    if not devices:
+        return store
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(devices))) as pool:
+        futures = {pool.submit(fetch_device, device, models, cache, targeted, streaming): device for device in devices}
+        for future in as_completed(futures):
+            device = futures[future]
+            try:
+                store[device.name] = future.result()
+            except Exception as e:
+                log.warning(f"Collecting RESTCONF data from { device.name } failed: { e }")
+    return store
@@ -0,0 +1,166 @@
+"""Single pass evaluation engine for the interface tests
+
+Every test section used to walk the YANG interface list on its own, so a
+device with N interfaces and M tests cost N x M iterations.  The engine
+walks the interface list once, runs every rule against each interface and
+hands each test section its precomputed verdicts.
+"""
+from collections import namedtuple
+
+PASSED = 'Passed'
+FAILED = 'Failed'
+
+# ----------------
+# One table row for one interface
+#   row     - the cells between Interface and Passed/Failed
+#   status  - PASSED, FAILED or None for rows that are only reported
+#   value   - what gets recorded in failed_interfaces when the row failed
+# ----------------
+class Verdict(namedtuple('Verdict', ['interface', 'row', 'status', 'value'])):
+
+    @property
+    def cells(self):
+        return self.row + (self.status or '',)
+
+    @property
+    def failed(self):
+        return self.status == FAILED
+
+    @property
+    def style(self):
+        if self.status == FAILED:
+            return "red"
+        if self.status == PASSED:
+            return "green"
+        return "yellow"
+
+def lookup(intf, path):
+    """Walk a tuple of keys into an interface element, None when a key is absent"""
+    value = intf
+    for key in path:
+        if not isinstance(value, dict) or key not in value:
+            return None
+        value = value[key]
+    return value
+
+# ----------------
+# Rules
+# ----------------
+class Rule:
+    """Base rule - evaluate() returns a Verdict or None when no row is reported"""
+
+    def __init__(self, name, path, requires=None):
+        self.name = name
+        self.path = tuple(path)
+        self.requires = tuple(requires) if requires else None
+
+    def applies(self, intf):
+        return self.requires is None or lookup(intf, self.requires) is not None
+
+    @property
+    def reads(self):
+        return [self.path]
+
+    @property
+    def leaves(self):
+        """Every path this rule looks at, used to build RESTCONF fields= queries"""
+        leaves = list(self.reads)
+        if self.requires and not any(leaf[:len(self.requires)] == self.requires for leaf in leaves):
+            leaves.append(self.requires)
+        return leaves
+
+    def evaluate(self, intf):
+        raise NotImplementedError
+
+class CounterRule(Rule):
+    """Fail when a counter is above the threshold, N/A when the counter is empty"""
+
+    def __init__(self, name, path, threshold=0, requires=None):
+        super().__init__(name, path, requires)
+        self.threshold = threshold
+
+    def evaluate(self, intf):
+        if not self.applies(intf):
+            return None
+        counter = lookup(intf, self.path)
+        if counter is None or counter == '':
+            return Verdict(intf['name'], ('N/A', 'N/A'), None, None)
+        if int(counter) > self.threshold:
+            return Verdict(intf['name'], (str(self.threshold), str(counter)), FAILED, int(counter))
+        return Verdict(intf['name'], (str(self.threshold), str(counter)), PASSED, None)
+
+class MatchRule(Rule):
+    """Fail when a leaf does not equal the expected value, N/A when the rule does not apply"""
+
+    def __init__(self, name, path, expected, requires=None):
+        super().__init__(name, path, requires)
+        self.expected = expected
+
+    def evaluate(self, intf):
+        if not self.applies(intf):
+            return Verdict(intf['name'], ('N/A',), None, None)
+        value = lookup(intf, self.path)
+        if value != self.expected:
+            return Verdict(intf['name'], (value,), FAILED, value)
+        return Verdict(intf['name'], (value,), PASSED, None)
+
+class AdminOperRule(Rule):
+    """Fail when the oper status does not match the admin status
+
+    expected maps an admin status to the oper status it requires, for models
+    where the two leaves use different enumerations; interfaces in any other
+    admin status are not reported.
+    """
+
+    def __init__(self, name, path, requires=None, expected=None):
+        super().__init__(name, path, requires)
+        self.expected = expected
+
+    @property
+    def reads(self):
+        return [self.path + ('admin-status',), self.path + ('oper-status',)]
+
+    def evaluate(self, intf):
+        if not self.applies(intf):
+            return None
+        admin_status = lookup(intf, self.path + ('admin-status',))
+        oper_status = lookup(intf, self.path + ('oper-status',))
+        if self.expected is None:
+            expected = admin_status
+        elif admin_status in self.expected:
+            expected = self.expected[admin_status]
+        else:
+            return None
+        if oper_status != expected:
+            return Verdict(intf['name'], (admin_status, oper_status), FAILED, oper_status)
+        return Verdict(intf['name'], (admin_status, oper_status), PASSED, None)
+
+class DescriptionRule(Rule):
+    """Fail when an interface has an empty or missing description"""
+
+    def evaluate(self, intf):
+        if not self.applies(intf):
+            return None
+        description = lookup(intf, self.path)
+        if description is None:
+            return Verdict(intf['name'], ('N/A',), FAILED, 'N/A')
+        if description:
+            return Verdict(intf['name'], (description,), PASSED, None)
+        return Verdict(intf['name'], (description,), FAILED, description)
+
+# ----------------
+# Engine
+# ----------------
+def evaluate(interfaces, rules):
+    """Walk the interfaces once, running every rule against each one
+
+    Returns a dict of rule name to the list of verdicts for that rule, in
+    interface order.
+    """
+    verdicts = {rule.name: [] for rule in rules}
+    for intf in interfaces:
+        for rule in rules:
+            verdict = rule.evaluate(intf)
+            if verdict is not None:
+                verdicts[rule.name].append(verdict)
+    return verdicts
@@ -0,0 +1,58 @@
+"""Failed checks as structured events for the post-run stage
+
+The testcases only decide pass or fail; asking ChatGPT, reading failures
+out with gTTS and sending them to WebEx all happen after the run in
+postprocess.py.  A failed check is handed over as one event, a plain dict
+holding the device, the check title and every verdict of the check so the
+stage can rebuild the same table, appended as a JSON line to a file of the
+task process in the events directory.
+"""
+import os
+import glob
+import threading
+import serializer
+from engine import Verdict
+from checks import MODELS
+
+# Every check by title, to resolve the events; uids repeat across the models
+CHECKS = {check.title: check for model in MODELS for check in model.checks}
+
+def failure(alias, check, verdicts):
+    """Event of a failed check"""
+    return {'type': 'failure', 'device': alias, 'check': check.title,
+            'verdicts': [[verdict.interface, list(verdict.row), verdict.status, verdict.value] for verdict in verdicts]}
+
+def verdicts(event):
+    """The verdicts an event was made from"""
+    return [Verdict(interface, tuple(row), status, value) for interface, row, status, value in event['verdicts']]
+
+class Emitter:
+    """Appends events to events-<pid>.jsonl in the directory
+
+    Each line is flushed as it is written, so whatever the task emitted is
+    on disk when the process ends, even after an error.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self.file = open(os.path.join(directory, f"events-{ os.getpid() }.jsonl"), 'ab')
+        self.lock = threading.Lock()
+
+    def emit(self, event):
+        line = serializer.dumps(event) + b'\n'
+        with self.lock:
+            self.file.write(line)
+            self.file.flush()
+
+    def close(self):
+        with self.lock:
+            self.file.close()
+
+def load(directory):
+    """Every event emitted into the directory, task by task"""
+    for filename in sorted(glob.glob(os.path.join(directory, 'events-*.jsonl'))):
+        with open(filename, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    yield serializer.loads(line)
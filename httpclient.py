@@ -0,0 +1,101 @@
+"""One pooled, keep-alive HTTP session for every outbound call
+
+WebEx posts used to go through module-level requests.post, opening a new
+TCP and TLS connection for every message.  They, and the OpenAI client, now
+share session: one connection pool per host kept alive between calls,
+timeouts on every request and retries of connections that could not be
+opened.  A request whose body was sent is never retried here, webex.post()
+decides which responses are worth sending again.
+
+retry_after() reads the delay a rate limited service asks for and retry()
+calls again whatever was rate limited, for WebEx and ChatGPT alike.  reuse()
+marks a metrics record with whether its call found an idle connection in the
+pool or had to open (and handshake) a new one, which the job exports as
+brainiac_external_connections_total.
+"""
+import time
+import logging
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Seconds to open a connection and to wait for the response
+TIMEOUT = (5, 30)
+
+# Idle connections kept per host
+POOL_SIZE = 8
+
+# Attempts to open a connection, backing off 0.5s, 1s, 2s
+CONNECT_RETRIES = 3
+BACKOFF = 0.5
+
+def create_session(pool_size=POOL_SIZE, retries=CONNECT_RETRIES, backoff=BACKOFF):
+    retry = Retry(total=retries, connect=retries, read=0, status=0, backoff_factor=backoff)
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+session = create_session()
+
+log = logging.getLogger(__name__)
+
+def retry_after(response, default):
+    """Seconds to wait before retrying, Retry-After is either seconds or an HTTP date
+
+    Takes anything with response headers, OpenAI's errors included.
+    """
+    value = (getattr(response, 'headers', None) or {}).get('Retry-After')
+    if value is None:
+        return default
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return default
+
+def retry(call, retryable, retries, backoff, describe, wait=time.sleep):
+    """Result of call(), called again while retryable() holds for its result or error
+
+    Each retry waits the Retry-After of the response or error, or backoff
+    doubled on every attempt; wait is handed the delay.  describe() of the
+    result or error heads the warning logged for every retry.  The last
+    attempt's result is returned, or its error raised, whatever it is.
+    retryable() and describe() are handed errors as well as results.
+    """
+    for attempt in range(retries + 1):
+        try:
+            outcome, failed = call(), False
+        except Exception as e:
+            outcome, failed = e, True
+        if attempt == retries or not retryable(outcome):
+            if failed:
+                raise outcome
+            return outcome
+        delay = retry_after(outcome, backoff * 2 ** attempt)
+        log.warning(f"{ describe(outcome) }, retrying in { delay:.0f}s ({ attempt + 1 }/{ retries })")
+        wait(delay)
+
+def pool(url):
+    """The urllib3 connection pool serving the url"""
+    return session.get_adapter(url).poolmanager.connection_from_url(url)
+
+@contextmanager
+def reuse(record, url):
+    """Set record['reused'] to whether the call made inside opened no new connection
+
+    Calls running at the same time on the same host can see each other's
+    connections, so under concurrency the split is approximate.
+    """
+    connections = pool(url)
+    opened = connections.num_connections
+    try:
+        yield record
+    finally:
+        record['reused'] = connections.num_connections == opened
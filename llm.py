@@ -0,0 +1,127 @@
+"""Pluggable LLM provider for the ChatGPT questions
+
+ChatGPT asks its provider for chat completions, so a failure-heavy run can
+be load tested offline and the cost of the enrichment measured on its own:
+
+    openai  the OpenAI API, needs OPENAI_KEY
+    stub    a deterministic local answer derived from the messages, with an
+            optional latency to stand in for the network
+    record  asks OpenAI and saves every exchange into a recordings directory
+    replay  answers from those recordings only, never reaching the network
+
+LLM_PROVIDER in the environment picks one by name, openai by default.
+Providers raise RateLimited when the service asks to slow down.
+"""
+import os
+import time
+import serializer
+import httpclient
+from cache import AnswerCache, write_atomic
+
+RECORDINGS_DIR = 'llm_recordings'
+
+class RateLimited(Exception):
+    """The provider was rate limited, headers carry its Retry-After"""
+
+    def __init__(self, message, headers=None):
+        super().__init__(message)
+        self.headers = headers or {}
+
+# Recordings are content addressed like the answer cache
+key = AnswerCache.key
+
+def last_question(messages):
+    return next((message['content'] for message in reversed(messages) if message['role'] == 'user'), '')
+
+class OpenAIProvider:
+    name = 'openai'
+    # Real answers are worth keeping in the AnswerCache
+    cached = True
+
+    def __init__(self, api_key=None):
+        import openai
+        self.openai = openai
+        if api_key:
+            openai.api_key = api_key
+        # ChatGPT shares the pooled keep-alive session with the WebEx posts
+        openai.requestssession = httpclient.session
+
+    def complete(self, model, messages, record=None):
+        """Text of the completion, record is the metrics record of the call"""
+        with httpclient.reuse(record if record is not None else {}, self.openai.api_base):
+            try:
+                response = self.openai.ChatCompletion.create(
+                    model=model,
+                    messages=messages
+                )
+            except self.openai.error.RateLimitError as e:
+                raise RateLimited(str(e), e.headers) from e
+        result = ''
+        for choice in response.choices:
+            result += choice.message.content
+        return result
+
+class StubProvider:
+    """Same answer for the same messages, offline and free"""
+    name = 'stub'
+    cached = False
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+
+    def complete(self, model, messages, record=None):
+        if self.latency:
+            time.sleep(self.latency)
+        question = last_question(messages)
+        return f"Stub answer { key(model, messages)[:12] } from { model } to { len(question) } characters: { question[:80] }"
+
+class RecordProvider:
+    """Asks another provider and saves every exchange for ReplayProvider"""
+    # Every question has to reach the provider to be recorded
+    cached = False
+
+    def __init__(self, provider, directory=RECORDINGS_DIR):
+        self.provider = provider
+        self.directory = directory
+        self.name = f"record-{ provider.name }"
+        os.makedirs(directory, exist_ok=True)
+
+    def complete(self, model, messages, record=None):
+        result = self.provider.complete(model, messages, record)
+        # Written atomically so a replay never reads a partial file
+        write_atomic(os.path.join(self.directory, f"{ key(model, messages) }.json"),
+                     serializer.dumps({'model': model, 'messages': messages, 'answer': result}, pretty=True))
+        return result
+
+class ReplayProvider:
+    """Answers from a recordings directory, LookupError for anything not recorded"""
+    name = 'replay'
+    cached = False
+
+    def __init__(self, directory=RECORDINGS_DIR):
+        self.directory = directory
+
+    def complete(self, model, messages, record=None):
+        filename = os.path.join(self.directory, f"{ key(model, messages) }.json")
+        try:
+            with open(filename, 'rb') as f:
+                return serializer.loads(f.read())['answer']
+        except FileNotFoundError:
+            raise LookupError(f"No recorded answer to { last_question(messages)[:80]!r} in { self.directory }") from None
+
+PROVIDERS = ('openai', 'stub', 'record', 'replay')
+
+def load_provider(name=None, api_key=None, directory=RECORDINGS_DIR):
+    """Instantiate the named provider, None when it needs OpenAI and there is no key"""
+    name = name or os.getenv("LLM_PROVIDER") or 'openai'
+    if name == 'stub':
+        return StubProvider()
+    if name == 'replay':
+        return ReplayProvider(directory)
+    if name not in PROVIDERS:
+        raise KeyError(f"Unknown LLM provider { name }, expected one of { ', '.join(PROVIDERS) }")
+    if not api_key:
+        return None
+    if name == 'record':
+        return RecordProvider(OpenAIProvider(api_key), directory)
+    return OpenAIProvider(api_key)
@@ -0,0 +1,147 @@
+"""Timing and resource metrics of the testscript
+
+Every aetest section of every device and every external call (RESTCONF,
+OpenAI, gTTS, WebEx, cairosvg) is measured with measure(): wall time, CPU
+time of the calling thread, bytes transferred and peak memory.  Peak memory
+is the traced peak of the section when tracemalloc runs (trace_memory
+script parameter), the process high-water RSS otherwise.
+
+Each testscript process dumps its records when it ends and the job merges
+them into metrics.json and Prometheus text-format metrics.prom.
+"""
+import os
+import glob
+import json
+import time
+import resource
+import threading
+import tracemalloc
+from contextlib import contextmanager
+
+records = []
+lock = threading.Lock()
+
+def peak_memory(section):
+    if section and tracemalloc.is_tracing():
+        return tracemalloc.get_traced_memory()[1]
+    # ru_maxrss is in KiB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+@contextmanager
+def measure(kind, name, device=None, test=None, testcase=None):
+    """Record one section or external call, the yielded record takes a bytes count
+
+    kind is 'section' or 'call'; sections also reset the tracemalloc peak so
+    they must not nest.  testcase tells apart the sections and check uids
+    every model's testcase repeats.
+    """
+    record = {'kind': kind, 'name': name, 'device': device, 'test': test, 'testcase': testcase, 'bytes': 0}
+    section = kind == 'section'
+    if section and tracemalloc.is_tracing():
+        tracemalloc.reset_peak()
+    wall, cpu = time.perf_counter(), time.thread_time()
+    try:
+        yield record
+    finally:
+        record['wall_seconds'] = time.perf_counter() - wall
+        record['cpu_seconds'] = time.thread_time() - cpu
+        record['peak_memory_bytes'] = peak_memory(section)
+        with lock:
+            records.append(record)
+
+def record(kind, name, device=None, test=None, wall_seconds=0.0, cpu_seconds=0.0, bytes=0, testcase=None):
+    """Add a measurement taken elsewhere, such as in a worker process"""
+    with lock:
+        records.append({'kind': kind, 'name': name, 'device': device, 'test': test, 'testcase': testcase, 'bytes': bytes,
+                        'wall_seconds': wall_seconds, 'cpu_seconds': cpu_seconds, 'peak_memory_bytes': peak_memory(False)})
+
+def dump(directory):
+    """Write this process' records into the directory, returns the file name"""
+    os.makedirs(directory, exist_ok=True)
+    filename = os.path.join(directory, f"metrics-{ os.getpid() }.json")
+    with lock:
+        with open(filename, 'w') as f:
+            json.dump(records, f)
+    return filename
+
+def load(directory):
+    """Every record dumped into the directory"""
+    merged = []
+    for filename in sorted(glob.glob(os.path.join(directory, 'metrics-*.json'))):
+        with open(filename) as f:
+            merged.extend(json.load(f))
+    return merged
+
+# ----------------
+# Prometheus text format
+# ----------------
+# Times are summed over repeated runs of a section, peak memory is the maximum
+SECTION_METRICS = [
+    ('brainiac_section_wall_seconds_total', 'wall_seconds', 'counter', 'Wall time spent in aetest sections'),
+    ('brainiac_section_cpu_seconds_total', 'cpu_seconds', 'counter', 'CPU time spent in aetest sections'),
+    ('brainiac_section_peak_memory_bytes', 'peak_memory_bytes', 'gauge', 'Peak memory during aetest sections'),
+]
+
+CALL_METRICS = [
+    ('brainiac_external_calls_total', None, 'External calls made'),
+    ('brainiac_external_call_seconds_total', 'wall_seconds', 'Wall time spent in external calls'),
+    ('brainiac_external_call_bytes_total', 'bytes', 'Bytes sent or received by external calls'),
+]
+
+# External calls that went through httpclient, by whether they reused a pooled connection
+CONNECTION_METRIC = ('brainiac_external_connections_total', 'External calls by whether they reused a kept-alive connection')
+
+def escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def labels(**values):
+    return ','.join(f'{ key }="{ escape(value) }"' for key, value in values.items() if value is not None)
+
+def prometheus(records):
+    """Prometheus text exposition of the records
+
+    Sections are per testcase, device and test, with peak memory the maximum
+    and the times summed over repeated runs; external calls are per service and
+    device, their connection reuse per service.
+    """
+    sections, calls, connections = {}, {}, {}
+    for record in records:
+        if record['kind'] == 'section':
+            # Records dumped before testcase was recorded have none
+            key = (record['name'], record.get('testcase'), record['device'], record['test'])
+            total = sections.setdefault(key, {'wall_seconds': 0.0, 'cpu_seconds': 0.0, 'peak_memory_bytes': 0})
+            total['wall_seconds'] += record['wall_seconds']
+            total['cpu_seconds'] += record['cpu_seconds']
+            total['peak_memory_bytes'] = max(total['peak_memory_bytes'], record['peak_memory_bytes'])
+        else:
+            key = (record['name'], record['device'])
+            total = calls.setdefault(key, {None: 0, 'wall_seconds': 0.0, 'bytes': 0})
+            total[None] += 1
+            total['wall_seconds'] += record['wall_seconds']
+            total['bytes'] += record['bytes']
+            if 'reused' in record:
+                key = (record['name'], 'true' if record['reused'] else 'false')
+                connections[key] = connections.get(key, 0) + 1
+    lines = []
+    for metric, field, type, description in SECTION_METRICS:
+        lines += [f"# HELP { metric } { description }", f"# TYPE { metric } { type }"]
+        for (name, testcase, device, test), total in sorted(sections.items(), key=lambda item: tuple(str(part) for part in item[0])):
+            lines.append(f"{ metric }{{{ labels(section=name, testcase=testcase, device=device, test=test) }}} { total[field] }")
+    for metric, field, description in CALL_METRICS:
+        lines += [f"# HELP { metric } { description }", f"# TYPE { metric } counter"]
+        for (name, device), total in sorted(calls.items(), key=lambda item: tuple(str(part) for part in item[0])):
+            lines.append(f"{ metric }{{{ labels(service=name, device=device) }}} { total[field] }")
+    metric, description = CONNECTION_METRIC
+    lines += [f"# HELP { metric } { description }", f"# TYPE { metric } counter"]
+    for (name, reused), count in sorted(connections.items()):
+        lines.append(f"{ metric }{{{ labels(service=name, reused=reused) }}} { count }")
+    return '\n'.join(lines) + '\n'
+
+def export(directory, output):
+    """Merge the dumped records into output/metrics.json and output/metrics.prom"""
+    merged = load(directory)
+    with open(os.path.join(output, 'metrics.json'), 'w') as f:
+        json.dump(merged, f, indent=4)
+    with open(os.path.join(output, 'metrics.prom'), 'w') as f:
+        f.write(prometheus(merged))
+    return merged
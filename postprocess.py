@@ -0,0 +1,127 @@
+"""Post-run stage enriching and sending the failures
+
+The testcases emit their failures as events (events.py) and go on, so a
+slow OpenAI, gTTS or WebEx no longer holds up a verdict or a device loop.
+Once the tasks are done brainiac_job.py runs this stage over the events of
+the whole run; a testscript run on its own does it in CommonCleanup.
+
+Every failed table is rebuilt from its event, rendered and rasterized in a
+process pool while the ChatGPT questions of all failures go through the
+ChatGPT pool, or a single prompt per device in the device mode; then each
+digest is read out by gTTS and posted to WebEx, a few digests at a time.
+"""
+import os
+import logging
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+from dotenv import load_dotenv
+from gtts import gTTS
+import llm
+import events
+import metrics
+from report import Report, rasterize, Rasterizer
+from webex import Digests
+from chatgpt import ChatGPT, MAX_CONCURRENCY, diagnose
+from cache import AnswerCache, ANSWER_DIR, ANSWER_TTL, ANSWER_CACHE_SIZE
+
+# ENV FOR WEBEX
+load_dotenv()
+
+webexToken = os.getenv("WEBEX_TOKEN")
+webexRoomId = os.getenv("WEBEX_ROOMID")
+openaiKey = os.getenv("OPENAI_KEY")
+
+log = logging.getLogger(__name__)
+
+# Digests read out and posted at once
+SEND_WORKERS = 4
+
+def add_png(digest, alias, check, png, wall_seconds, cpu_seconds):
+    metrics.record('call', 'cairosvg', alias, check.uid, wall_seconds, cpu_seconds, len(png))
+    # Save SVG to PNG
+    with open(f"Test Results/{ alias } { check.title }.png", 'wb') as f:
+        f.write(png)
+    digest.add_file(f"{ alias } { check.title }.png", png)
+
+def send(alias, digest):
+    # One MP3 reading out every failure of the digest
+    mp3 = f"MP3/{ digest.title }.mp3"
+    with metrics.measure('call', 'gtts', alias) as record:
+        gTTS(text=digest.speech, lang='en').save(mp3)
+        record['bytes'] = os.path.getsize(mp3)
+    with open(mp3, 'rb') as f:
+        digest.add_file(os.path.basename(mp3), f.read())
+    digest.send(webexToken, webexRoomId, alias)
+
+def run(directory, webex_digest='device', png_workers=2, chatgpt_workers=MAX_CONCURRENCY, chatgpt_cache=ANSWER_DIR,
+        chatgpt_cache_ttl=ANSWER_TTL, chatgpt_cache_size=ANSWER_CACHE_SIZE, chatgpt_mode='questions',
+        llm_provider=None, llm_recordings=llm.RECORDINGS_DIR, send_workers=SEND_WORKERS):
+    """Enrich and send every failure emitted into the directory, returns how many there were
+
+    llm_provider is a name from llm.PROVIDERS, LLM_PROVIDER or openai when
+    None, or a provider instance such as a StubProvider with some latency.
+    """
+    digests = Digests(webex_digest) if webexToken else None
+    rasterizer = Rasterizer(png_workers) if digests and png_workers else None
+    if llm_provider is None or isinstance(llm_provider, str):
+        llm_provider = llm.load_provider(llm_provider, openaiKey, llm_recordings)
+    chatgpt = None
+    if llm_provider:
+        answer_cache = AnswerCache(chatgpt_cache, chatgpt_cache_ttl, chatgpt_cache_size) if chatgpt_cache else None
+        chatgpt = ChatGPT(llm_provider, chatgpt_workers, answer_cache)
+
+    questions = []
+    # alias -> (digest, [(check, {interface: value})]) in the device mode
+    devices = {}
+    count = 0
+    try:
+        for event in events.load(directory):
+            count += 1
+            alias, check = event['device'], events.CHECKS[event['check']]
+            digest = digests[alias] if digests else None
+            report = Report(alias, check, events.verdicts(event))
+            if digest is not None:
+                digest.add(alias, check, report.failed)
+                # Only the PNGs WebEx gets are rasterized, in the process pool when it runs
+                if rasterizer:
+                    rasterizer.submit(report.svg, partial(add_png, digest, alias, check))
+                else:
+                    add_png(digest, alias, check, *rasterize(report.svg))
+            if chatgpt and chatgpt_mode == 'device':
+                # The device prompt covers every failed check, whether or not it has questions of its own
+                failed = {verdict.interface: verdict.value for verdict in report.failed}
+                devices.setdefault(alias, (digest, []))[1].append((check, failed))
+            elif chatgpt and check.questions:
+                # Every question of every failure is in flight before the first answer is read
+                questions.append((alias, digest, check.questions, chatgpt.submit(check.questions, alias, check.uid)))
+        for alias, (digest, failures) in devices.items():
+            # Headed by a summary in the log and the digest, the prompt itself lists every failure
+            questions.append((alias, digest, [f"Diagnosis of { len(failures) } failed checks"],
+                              chatgpt.submit([diagnose(alias, failures)], alias)))
+
+        for alias, digest, asked, answers in questions:
+            for question, answer in zip(asked, answers):
+                try:
+                    result = answer.result()
+                except Exception as e:
+                    log.error(f"Asking ChatGPT { question } for { alias } failed: { e }")
+                    continue
+                log.info(f"We asked chatGPT { question } - here was there response:")
+                log.info(result)
+                if digest is not None:
+                    digest.add_answer(alias, question, result)
+    finally:
+        if rasterizer:
+            rasterizer.close()
+        if chatgpt:
+            chatgpt.close()
+
+    if digests:
+        with ThreadPoolExecutor(send_workers) as pool:
+            futures = [pool.submit(send, alias, digest) for alias, digest in digests.items()]
+        for future in futures:
+            try:
+                future.result()
+            except Exception as e:
+                log.error(f"Sending a WebEx digest failed: { e }")
+    return count
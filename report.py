@@ -0,0 +1,257 @@
+"""Rich rendering of the check results
+
+Shared by the testcases and the benchmarks so both time the same work.
+A Report keeps the structured rows of a check and only renders the table
+text or SVG when something reads them, so checks nobody looks at cost no
+rendering.  Every report of a worker renders through one RenderContext, a
+recording Console and output buffer that are reset and reused instead of
+allocated per table.  PNGs are only needed for WebEx uploads; they are rasterized
+from the SVG markup in memory by a process pool so the testcases do not
+wait on cairo.
+"""
+import io
+import os
+import re
+import glob
+import time
+import logging
+import threading
+import cairosvg
+from html import escape
+from urllib.parse import quote
+from xml.sax.saxutils import quoteattr
+from functools import cached_property
+from concurrent.futures import ProcessPoolExecutor
+from rich.console import Console
+from rich.table import Table
+import serializer
+
+log = logging.getLogger(__name__)
+
+def build_table(alias, check, verdicts):
+    """Rich table of one check for one device"""
+    table = Table(title=check.title)
+    table.add_column("Device", style="cyan")
+    table.add_column("Interface", style="blue")
+    for column in check.columns:
+        table.add_column(column, style="magenta")
+    table.add_column("Passed/Failed", style="green")
+    for verdict in verdicts:
+        table.add_row(alias,verdict.interface,*verdict.cells,style=verdict.style)
+    return table
+
+def render(table):
+    """Print the table into a new recording console, returns the console and the text"""
+    console = Console(record=True)
+    with console.capture() as capture:
+        console.print(table,justify="center")
+    return console, capture.get()
+
+class RenderContext:
+    """One recording Console and output buffer reused for every table
+
+    The console records the last rendered table only; owner is the report
+    it belongs to, so a report rendered earlier knows to render again.
+    """
+
+    def __init__(self):
+        self.buffer = io.StringIO()
+        self.console = Console(record=True, file=self.buffer)
+        self.owner = None
+
+    def reset(self):
+        self.buffer.seek(0)
+        self.buffer.truncate()
+        # Exporting is the public way to clear the recording, export_svg already did
+        self.console.export_text(clear=True)
+
+    def render(self, table, owner=None):
+        """Text of the table, which stays recorded for export_svg"""
+        self.reset()
+        self.owner = owner
+        self.console.print(table,justify="center")
+        return self.buffer.getvalue()
+
+    def export_svg(self, title):
+        self.owner = None
+        return self.console.export_svg(title=title)
+
+local = threading.local()
+
+def shared_context():
+    """The render context of the calling worker thread"""
+    if not hasattr(local, 'context'):
+        local.context = RenderContext()
+    return local.context
+
+# Which checks get an SVG in Test Results/
+ARTIFACTS = ('none', 'failed', 'all')
+
+class Report:
+    """Rows of one check for one device, rendered on first use"""
+
+    def __init__(self, alias, check, verdicts, context=None):
+        self.alias = alias
+        self.check = check
+        self.verdicts = verdicts
+        self.context = context or shared_context()
+
+    @property
+    def title(self):
+        return f"{ self.alias } { self.check.title }"
+
+    @cached_property
+    def failed(self):
+        return [verdict for verdict in self.verdicts if verdict.failed]
+
+    def render(self):
+        return self.context.render(build_table(self.alias, self.check, self.verdicts), self)
+
+    @cached_property
+    def text(self):
+        return self.render()
+
+    @cached_property
+    def svg(self):
+        # The console records only the last table rendered
+        if self.context.owner is not self:
+            self.text = self.render()
+        return self.context.export_svg(self.title)
+
+    def wants_svg(self, artifacts='failed'):
+        return artifacts == 'all' or (artifacts == 'failed' and bool(self.failed))
+
+def rasterize(svg):
+    """PNG of SVG markup, with the wall and CPU seconds the conversion took"""
+    wall, cpu = time.perf_counter(), time.process_time()
+    png = cairosvg.svg2png(bytestring=svg.encode())
+    return png, time.perf_counter() - wall, time.process_time() - cpu
+
+class Rasterizer:
+    """Process pool converting SVG markup to PNG off the testcase thread
+
+    submit() hands the result to a callback, called from a pool thread once
+    the PNG is ready; close() waits for every conversion and callback.
+    """
+
+    def __init__(self, processes=2):
+        self.pool = ProcessPoolExecutor(processes)
+
+    def submit(self, svg, callback):
+        def done(future):
+            try:
+                callback(*future.result())
+            except Exception as e:
+                log.error(f"Handling a rasterized PNG failed: { e }")
+        self.pool.submit(rasterize, svg).add_done_callback(done)
+
+    def close(self):
+        self.pool.shutdown(wait=True)
+
+# ----------------
+# Consolidated HTML reports
+# ----------------
+# tests writes one SVG per test, device and run one HTML document per device or per testscript run
+LAYOUTS = ('tests', 'device', 'run')
+
+REPORT_DIR = 'Test Results'
+
+STYLE = """body { font-family: sans-serif; background: #1e1e1e; color: #ddd; }
+table.index { border-collapse: collapse; margin-bottom: 2em; }
+table.index td, table.index th { padding: 2px 12px; text-align: left; }
+tr.failed td { color: #f55; } tr.passed td { color: #5d5; }
+a { color: inherit; }
+section svg { max-width: 100%; height: auto; }"""
+
+def anchor(*parts):
+    return re.sub(r'[^A-Za-z0-9_-]+', '-', ' '.join(parts)).strip('-')
+
+def html_document(title, rows, sections):
+    """HTML page with an index table over the sections, rows are (href, device, test, failed)"""
+    index = '\n'.join(
+        f'<tr class="{ "failed" if count else "passed" }"><td>{ escape(device) }</td>'
+        f'<td>{ f"<a href={ quoteattr(href) }>{ escape(test) }</a>" if href else escape(test) }</td>'
+        f'<td>{ f"Failed ({ count })" if count else "Passed" }</td></tr>'
+        for href, device, test, count in rows)
+    return f"""<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{ escape(title) }</title>
+<style>
+{ STYLE }
+</style>
+</head>
+<body>
+<h1>{ escape(title) }</h1>
+<table class="index">
+<tr><th>Device</th><th>Test</th><th>Result</th></tr>
+{ index }
+</table>
+{ ''.join(sections) }
+</body>
+</html>
+"""
+
+class Consolidated:
+    """Collects every check of the run into one HTML document per device or per run
+
+    All checks are listed in the document's index; the SVG tables are only
+    embedded for the checks the artifacts setting selects.  When the job
+    shards the testbed each task dump()s its checks and the job load()s them
+    all, so the run layout is one document for the whole run.
+    """
+
+    def __init__(self, layout='device', directory=REPORT_DIR):
+        self.layout = layout
+        self.directory = directory
+        self.checks = {}
+
+    def add(self, report, artifacts='failed'):
+        svg = report.svg if report.wants_svg(artifacts) else None
+        self.checks.setdefault(report.alias, []).append((report.check.title, len(report.failed), svg))
+
+    def dump(self, directory):
+        """Write the checks of this task into the directory for the job to merge"""
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, f"consolidated-{ os.getpid() }.json"), 'wb') as f:
+            f.write(serializer.dumps(self.checks))
+
+    @classmethod
+    def load(cls, source, layout='device', directory=REPORT_DIR):
+        """Every task's checks dumped into source"""
+        consolidated = cls(layout, directory)
+        for filename in sorted(glob.glob(os.path.join(source, 'consolidated-*.json'))):
+            with open(filename, 'rb') as f:
+                for alias, checks in serializer.loads(f.read()).items():
+                    consolidated.checks.setdefault(alias, []).extend(tuple(check) for check in checks)
+        return consolidated
+
+    def documents(self):
+        if self.layout == 'run':
+            yield 'brainiac run', sorted(self.checks)
+        else:
+            for alias in sorted(self.checks):
+                yield alias, [alias]
+
+    def write(self):
+        """Write the documents and an index.html linking them, returns the documents' file names"""
+        os.makedirs(self.directory, exist_ok=True)
+        names, index = [], []
+        for title, aliases in self.documents():
+            rows, sections = [], []
+            for alias in aliases:
+                for test, failed, svg in self.checks[alias]:
+                    section = anchor(alias, test)
+                    rows.append((f"#{ section }" if svg else '', alias, test, failed))
+                    if svg:
+                        sections.append(f'<section id="{ section }">\n<h2>{ escape(alias) } { escape(test) }</h2>\n{ svg }\n</section>\n')
+            name = os.path.join(self.directory, f"{ title }.html")
+            with open(name, 'w', encoding='utf-8') as f:
+                f.write(html_document(title, rows, sections))
+            names.append(name)
+            index.append((quote(os.path.basename(name)), title, 'All tests', sum(1 for row in rows if row[3])))
+        # Only this run's documents, whatever earlier runs left in the directory
+        with open(os.path.join(self.directory, 'index.html'), 'w', encoding='utf-8') as f:
+            f.write(html_document('brainiac', index, []))
+        return names
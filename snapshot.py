@@ -0,0 +1,145 @@
+"""Reading and writing the JSON/ snapshots
+
+Snapshots are pretty printed, key sorted JSON by default.  The msgpack
+format stores the same payload as zstd compressed msgpack, a fraction of
+the size and much cheaper to write when hundreds of devices are polled
+every few minutes.  It needs the optional msgpack and zstandard packages.
+load() reads either format back, and running this module prints any
+snapshot as pretty JSON for diffing:
+
+    python snapshot.py JSON/csr1000v-1_OpenConfig_Interfaces.msgpack.zst
+"""
+import os
+import sys
+import queue
+import shutil
+import logging
+import threading
+import serializer
+
+try:
+    import msgpack
+    import zstandard
+except ImportError:
+    msgpack = zstandard = None
+
+log = logging.getLogger(__name__)
+
+SNAPSHOT_DIR = 'JSON'
+
+# File extension of each snapshot format
+EXTENSIONS = {
+    'json': '.json',
+    'msgpack': '.msgpack.zst',
+}
+
+# zstd level, 3 is the zstd default and already close to the best ratio for this data
+LEVEL = 3
+
+def filename(alias, model, format='json', directory=SNAPSHOT_DIR):
+    return os.path.join(directory, f"{ alias }_{ model.snapshot }{ EXTENSIONS[format] }")
+
+def find(alias, model, directory=SNAPSHOT_DIR):
+    """The newest snapshot of a model for a device in any format, or None"""
+    names = [name for name in (filename(alias, model, format, directory) for format in EXTENSIONS) if os.path.exists(name)]
+    return max(names, key=os.path.getmtime, default=None)
+
+def discard_others(alias, model, format, directory=SNAPSHOT_DIR):
+    """Remove the snapshots of the other formats, so a replay never reads a stale one"""
+    for other in EXTENSIONS:
+        if other != format:
+            try:
+                os.remove(filename(alias, model, other, directory))
+            except FileNotFoundError:
+                pass
+
+def aliases(directory=SNAPSHOT_DIR, models=()):
+    """Aliases of the devices with a snapshot of any of the models in the directory"""
+    found = set()
+    for name in os.listdir(directory):
+        for model in models:
+            for extension in EXTENSIONS.values():
+                suffix = f"_{ model.snapshot }{ extension }"
+                if name.endswith(suffix):
+                    found.add(name[:-len(suffix)])
+    return sorted(found)
+
+def untracked(testbed, directory=SNAPSHOT_DIR, models=()):
+    """Aliases with snapshots in the directory but no device in the testbed"""
+    known = set(testbed.devices) | {device.alias for device in testbed.devices.values()}
+    return [alias for alias in aliases(directory, models) if alias not in known]
+
+def dump(payload, alias, model, format='json', directory=SNAPSHOT_DIR):
+    """Write a snapshot, returns its file name"""
+    if format == 'msgpack' and msgpack is None:
+        log.warning("msgpack snapshots need the msgpack and zstandard packages, writing JSON")
+        format = 'json'
+    name = filename(alias, model, format, directory)
+    if format == 'msgpack':
+        data = zstandard.ZstdCompressor(level=LEVEL).compress(msgpack.packb(payload, use_bin_type=True))
+    else:
+        data = serializer.dumps(payload, pretty=True)
+    with open(name, 'wb') as f:
+        f.write(data)
+    discard_others(alias, model, format, directory)
+    return name
+
+def copy(source, alias, model, directory=SNAPSHOT_DIR):
+    """Write a JSON body spooled to a file as the snapshot as is, returns its file name"""
+    name = shutil.copyfile(source, filename(alias, model, 'json', directory))
+    discard_others(alias, model, 'json', directory)
+    return name
+
+def load(name):
+    """Read a snapshot back in whichever format it was written"""
+    with open(name, 'rb') as f:
+        data = f.read()
+    if name.endswith(EXTENSIONS['msgpack']):
+        if msgpack is None:
+            raise ImportError(f"{ name } needs the msgpack and zstandard packages")
+        return msgpack.unpackb(zstandard.ZstdDecompressor().decompress(data), raw=False)
+    return serializer.loads(data)
+
+class Writer:
+    """Background thread writing snapshots while the checks run
+
+    At most max_pending snapshots wait in the queue, submitting more blocks
+    until the disk catches up so a slow disk applies backpressure instead of
+    holding every device's payload in memory.
+    """
+
+    def __init__(self, max_pending=8):
+        self.queue = queue.Queue(maxsize=max_pending)
+        self.errors = []
+        self.thread = threading.Thread(target=self.run, name='snapshot-writer', daemon=True)
+        self.thread.start()
+
+    def submit(self, function, *args):
+        """Queue function(*args), blocking while the queue is full"""
+        self.queue.put((function, args))
+
+    def run(self):
+        while True:
+            function, args = self.queue.get()
+            try:
+                if function is None:
+                    return
+                function(*args)
+            except Exception as e:
+                log.error(f"Writing a snapshot failed: { e }")
+                self.errors.append(e)
+            finally:
+                self.queue.task_done()
+
+    def flush(self):
+        """Wait until every queued snapshot is on disk"""
+        self.queue.join()
+
+    def close(self):
+        self.flush()
+        self.queue.put((None, ()))
+        self.thread.join()
+
+if __name__ == '__main__':
+    for name in sys.argv[1:]:
+        sys.stdout.write(serializer.StdlibBackend().dumps(load(name), pretty=True).decode() + '\n')
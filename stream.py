@@ -0,0 +1,59 @@
+"""Streaming decode of RESTCONF interface lists
+
+The interface models of a large aggregation router run to tens of MB, and
+decoding them with .json() builds the whole dict tree before any check
+runs.  In streaming mode the response body is spooled to disk undecoded
+and the interface list is read back one element at a time, so each
+interface is evaluated and dropped and memory stays flat regardless of the
+interface count.
+"""
+import re
+import json
+import codecs
+
+# Bytes read from a response body or file at a time
+CHUNK_SIZE = 1 << 16
+
+# Start of the list every interface model keeps under its top level container
+INTERFACE_LIST = re.compile(r'"interface"\s*:\s*\[')
+
+decoder = json.JSONDecoder()
+
+def iter_interfaces(chunks):
+    """Yield the elements of the interface list of a RESTCONF document
+
+    chunks is any iterable of bytes, such as response.iter_content() or a
+    file read in blocks.  Only the element being decoded is held in memory.
+    """
+    utf8 = codecs.getincrementaldecoder('utf-8')()
+    chunks = iter(chunks)
+    buffer = ''
+    # Skip ahead to the start of the interface list
+    for chunk in chunks:
+        buffer += utf8.decode(chunk)
+        match = INTERFACE_LIST.search(buffer)
+        if match:
+            buffer = buffer[match.end():]
+            break
+    else:
+        raise ValueError("document has no interface list")
+    while True:
+        buffer = buffer.lstrip().lstrip(',').lstrip()
+        if buffer.startswith(']'):
+            return
+        try:
+            element, end = decoder.raw_decode(buffer)
+        except ValueError:
+            # The element runs past the end of the buffer, read some more
+            chunk = next(chunks, None)
+            if chunk is None:
+                raise ValueError("document ends inside the interface list")
+            buffer += utf8.decode(chunk)
+            continue
+        yield element
+        buffer = buffer[end:]
+
+def iter_file(filename, chunk_size=CHUNK_SIZE):
+    """Yield the interfaces of a spooled RESTCONF document one at a time"""
+    with open(filename, 'rb') as f:
+        yield from iter_interfaces(iter(lambda: f.read(chunk_size), b''))
@@ -0,0 +1,88 @@
+import json
+import pytest
+import collector
+from cache import ResponseCache
+from collector import fetch, spool, MissingContainer
+from stream import iter_file
+
+PATH = 'openconfig-interfaces:interfaces'
+FIELDS = 'interface(name;state/counters/in-errors)'
+PAYLOAD = {PATH: {'interface': [{'name': 'GigabitEthernet1', 'state': {'counters': {'in-errors': '0'}}}]}}
+
+class RequestException(IOError):
+    """What rest.connector raises for an unexpected code, with no response attached"""
+
+class Response:
+    def __init__(self, status_code, content):
+        self.status_code = status_code
+        self.content = content
+
+    def iter_content(self, chunk_size):
+        return [self.content[start:start + chunk_size] for start in range(0, len(self.content), chunk_size)]
+
+class Rest:
+    """rest.connector's IOS-XE get(), answering fields= queries with status and the full tree with 200"""
+
+    def __init__(self, status, body=b''):
+        self.status = status
+        self.body = body
+        self.urls = []
+
+    def get(self, api_url, expected_status_codes=(204, 200)):
+        self.urls.append(api_url)
+        if 'fields=' in api_url:
+            response = Response(self.status, self.body)
+        else:
+            response = Response(200, json.dumps(PAYLOAD).encode())
+        if response.status_code not in expected_status_codes:
+            raise RequestException(f"'{ response.status_code }' result code has been returned instead of the expected status code(s)")
+        return response
+
+class Device:
+    def __init__(self, name, rest):
+        self.name = self.alias = name
+        self.rest = rest
+
+@pytest.fixture(autouse=True)
+def unfiltered():
+    collector.UNFILTERED.clear()
+    yield
+    collector.UNFILTERED.clear()
+
+@pytest.mark.parametrize('status', [400, 501])
+def test_rejected_fields_fall_back_to_the_full_tree(status):
+    device = Device('r1', Rest(status))
+    assert fetch(device, PATH, fields=FIELDS) == PAYLOAD
+    assert device.rest.urls == [f"/restconf/data/{ PATH }?fields={ FIELDS }", f"/restconf/data/{ PATH }"]
+    # Later models go straight to the full tree
+    fetch(device, PATH, fields=FIELDS)
+    assert device.rest.urls[-1] == f"/restconf/data/{ PATH }"
+
+def test_empty_reply_falls_back_to_the_full_tree():
+    device = Device('r1', Rest(204))
+    assert fetch(device, PATH, fields=FIELDS) == PAYLOAD
+    assert 'r1' in collector.UNFILTERED
+
+def test_reply_without_the_container_falls_back_to_the_full_tree():
+    device = Device('r1', Rest(200, b'{"ietf-restconf:errors": {}}'))
+    assert fetch(device, PATH, fields=FIELDS) == PAYLOAD
+
+def test_other_errors_are_raised():
+    device = Device('r1', Rest(503))
+    with pytest.raises(RequestException):
+        fetch(device, PATH, fields=FIELDS)
+    assert device.rest.urls == [f"/restconf/data/{ PATH }?fields={ FIELDS }"]
+    assert not collector.UNFILTERED
+
+def test_empty_full_tree_is_missing_the_container():
+    device = Device('r1', Rest(200))
+    device.rest.get = lambda api_url, expected_status_codes=(204, 200): Response(204, b'')
+    with pytest.raises(MissingContainer):
+        fetch(device, PATH)
+
+@pytest.mark.parametrize('status', [204, 400])
+def test_spool_falls_back_to_the_full_tree(tmp_path, status):
+    device = Device('r1', Rest(status))
+    filename = spool(device, PATH, ResponseCache(str(tmp_path)), FIELDS)
+    assert list(iter_file(filename)) == PAYLOAD[PATH]['interface']
+    assert device.rest.urls[-1] == f"/restconf/data/{ PATH }"
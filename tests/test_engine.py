@@ -0,0 +1,108 @@
+from engine import evaluate, lookup, CounterRule, MatchRule, AdminOperRule, DescriptionRule, PASSED, FAILED
+from checks import OPENCONFIG, IOS_XE_OPER, IETF_INTERFACES_STATE, counter
+
+COUNTERS = ('state', 'counters')
+ETHERNET = ('openconfig-if-ethernet:ethernet',)
+
+def interface(name, **leaves):
+    """An interface element, each keyword is a leaf path with __ between keys and _ for -"""
+    intf = {'name': name}
+    for path, value in leaves.items():
+        node = intf
+        *keys, leaf = path.split('__')
+        for key in keys:
+            node = node.setdefault(key.replace('_', '-'), {})
+        node[leaf.replace('_', '-')] = value
+    return intf
+
+def test_lookup():
+    intf = interface('Gi1', state__counters__in_errors='3')
+    assert lookup(intf, COUNTERS + ('in-errors',)) == '3'
+    assert lookup(intf, COUNTERS + ('out-errors',)) is None
+    assert lookup(intf, COUNTERS + ('in-errors', 'deeper')) is None
+
+def test_counter_threshold():
+    rule = CounterRule('errors', COUNTERS + ('in-errors',), threshold=5)
+    interfaces = [interface('Gi1', state__counters__in_errors='5'), interface('Gi2', state__counters__in_errors='6')]
+    passed, failed = evaluate(interfaces, [rule])['errors']
+    assert passed.status == PASSED and passed.row == ('5', '5') and passed.value is None
+    assert failed.status == FAILED and failed.row == ('5', '6') and failed.value == 6
+    assert failed.failed and failed.style == 'red' and passed.style == 'green'
+
+def test_counter_not_available():
+    rule = CounterRule('errors', COUNTERS + ('in-errors',))
+    interfaces = [interface('Gi1', state__counters__in_errors=''), interface('Gi2', state__counters={})]
+    for verdict in evaluate(interfaces, [rule])['errors']:
+        assert verdict.row == ('N/A', 'N/A')
+        assert verdict.status is None and not verdict.failed
+        assert verdict.cells == ('N/A', 'N/A', '')
+        assert verdict.style == 'yellow'
+
+def test_requires_skips_interfaces():
+    rule = CounterRule('crc', ETHERNET + COUNTERS + ('in-crc-errors',), requires=ETHERNET)
+    interfaces = [interface('Loopback0', state__counters__in_errors='0'),
+                  interface('Gi1', **{'openconfig-if-ethernet:ethernet__state__counters__in_crc_errors': '1'})]
+    verdicts = evaluate(interfaces, [rule])['crc']
+    assert [verdict.interface for verdict in verdicts] == ['Gi1']
+    assert verdicts[0].failed
+
+def test_requires_is_a_leaf():
+    rule = CounterRule('crc', ETHERNET + COUNTERS + ('in-crc-errors',), requires=ETHERNET)
+    assert rule.leaves == [ETHERNET + COUNTERS + ('in-crc-errors',)]
+    rule = DescriptionRule('description', ('config', 'description'), requires=('state', 'type'))
+    assert rule.leaves == [('config', 'description'), ('state', 'type')]
+
+def test_optional_counter_reports_only_interfaces_with_the_leaf():
+    check = counter("Test", 'test_flaps', "Flaps", ('statistics', 'num-flaps'), optional=True)
+    interfaces = [interface('Gi1', statistics__num_flaps='2'), interface('Gi2', statistics__in_errors='0')]
+    verdicts = evaluate(interfaces, [check.rule])['test_flaps']
+    assert [(verdict.interface, verdict.status) for verdict in verdicts] == [('Gi1', FAILED)]
+
+def test_match_rule():
+    rule = MatchRule('duplex', ETHERNET + ('state', 'negotiated-duplex-mode'), "FULL", requires=ETHERNET)
+    interfaces = [interface('Gi1', **{'openconfig-if-ethernet:ethernet__state__negotiated_duplex_mode': 'FULL'}),
+                  interface('Gi2', **{'openconfig-if-ethernet:ethernet__state__negotiated_duplex_mode': 'HALF'}),
+                  interface('Loopback0')]
+    full, half, loopback = evaluate(interfaces, [rule])['duplex']
+    assert full.status == PASSED
+    assert half.status == FAILED and half.value == 'HALF'
+    assert loopback.row == ('N/A',) and loopback.status is None
+
+def test_admin_oper_same_enumeration():
+    rule = AdminOperRule('status', ())
+    interfaces = [interface('Gi1', admin_status='up', oper_status='up'),
+                  interface('Gi2', admin_status='up', oper_status='down')]
+    up, down = evaluate(interfaces, [rule])['status']
+    assert up.status == PASSED and up.row == ('up', 'up')
+    assert down.status == FAILED and down.value == 'down'
+
+def test_admin_oper_ios_xe_mapping():
+    rule = IOS_XE_OPER.checks[-1].rule
+    interfaces = [interface('Gi1', admin_status='if-state-up', oper_status='if-oper-state-ready'),
+                  interface('Gi2', admin_status='if-state-up', oper_status='if-oper-state-no-pass'),
+                  interface('Gi3', admin_status='if-state-down', oper_status='if-oper-state-no-pass')]
+    verdicts = evaluate(interfaces, [rule])[rule.name]
+    # Shut down interfaces have no expected oper status and are not reported
+    assert [(verdict.interface, verdict.status) for verdict in verdicts] == [('Gi1', PASSED), ('Gi2', FAILED)]
+    assert verdicts[1].value == 'if-oper-state-no-pass'
+
+def test_description_rule():
+    rule = DescriptionRule('description', ('description',))
+    interfaces = [interface('Gi1', description='uplink'), interface('Gi2', description=''), interface('Gi3')]
+    described, empty, missing = evaluate(interfaces, [rule])['description']
+    assert described.status == PASSED
+    assert empty.status == FAILED and empty.value == ''
+    assert missing.status == FAILED and missing.row == ('N/A',)
+
+def test_empty_interface_list():
+    for model in (OPENCONFIG, IOS_XE_OPER, IETF_INTERFACES_STATE):
+        assert evaluate([], model.rules) == {uid: [] for uid in model.uids}
+
+def test_every_rule_sees_every_interface_in_order():
+    interfaces = [interface(f'Gi{ index }', state__counters__in_errors=str(index), state__counters__out_errors='0')
+                  for index in range(3)]
+    rules = [CounterRule('in', COUNTERS + ('in-errors',)), CounterRule('out', COUNTERS + ('out-errors',))]
+    verdicts = evaluate(interfaces, rules)
+    assert [verdict.interface for verdict in verdicts['in']] == ['Gi0', 'Gi1', 'Gi2']
+    assert [verdict.status for verdict in verdicts['in']] == [PASSED, FAILED, FAILED]
+    assert all(verdict.status == PASSED for verdict in verdicts['out'])
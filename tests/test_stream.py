@@ -0,0 +1,52 @@
+import json
+import pytest
+from stream import iter_interfaces, iter_file
+
+INTERFACES = [
+    {'name': 'GigabitEthernet1', 'description': 'uplink to core', 'state': {'counters': {'in-errors': '0'}}},
+    {'name': 'GigabitEthernet2', 'description': 'Zürich – Genève ✓', 'state': {'counters': {'in-errors': '12'}}},
+    {'name': 'Loopback0', 'description': '', 'nested': [[1, 2], {'a': [']', '[']}]},
+]
+
+def document(interfaces, indent=None):
+    return json.dumps({'openconfig-interfaces:interfaces': {'interface': interfaces}}, indent=indent, ensure_ascii=False).encode()
+
+def split(data, size):
+    return [data[start:start + size] for start in range(0, len(data), size)]
+
+@pytest.mark.parametrize('size', [1, 2, 3, 7, 64, 1 << 16])
+def test_elements_split_across_chunks(size):
+    assert list(iter_interfaces(split(document(INTERFACES), size))) == INTERFACES
+
+def test_utf8_split_inside_a_character():
+    data = document(INTERFACES)
+    # Cut in the middle of every multi byte character
+    cuts = [index for index, byte in enumerate(data) if byte & 0xC0 == 0x80]
+    assert cuts
+    chunks, start = [], 0
+    for cut in cuts:
+        chunks.append(data[start:cut])
+        start = cut
+    chunks.append(data[start:])
+    assert list(iter_interfaces(chunks)) == INTERFACES
+
+def test_pretty_printed_document():
+    assert list(iter_interfaces(split(document(INTERFACES, indent=2), 5))) == INTERFACES
+
+def test_empty_interface_list():
+    assert list(iter_interfaces([document([])])) == []
+    assert list(iter_interfaces(split(document([], indent=2), 1))) == []
+
+def test_no_interface_list():
+    with pytest.raises(ValueError):
+        list(iter_interfaces([b'{"openconfig-interfaces:interfaces": {}}']))
+
+def test_truncated_document():
+    data = document(INTERFACES)
+    with pytest.raises(ValueError):
+        list(iter_interfaces([data[:len(data) // 2]]))
+
+def test_iter_file(tmp_path):
+    filename = tmp_path / 'spooled.json'
+    filename.write_bytes(document(INTERFACES))
+    assert list(iter_file(str(filename), chunk_size=3)) == INTERFACES
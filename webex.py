@@ -0,0 +1,146 @@
+"""WebEx digests of the failed checks
+
+Posting every failed interface, PNG and ChatGPT answer as its own message
+made hundreds of serial HTTPS requests for a noisy router, and WebEx rate
+limits them.  A Digest collects the failures of one device, or of the whole
+testscript run, and send() posts them as a single message: a markdown
+summary with one zip attachment holding the check PNGs, one MP3 reading out
+every failure and the full text.  post() waits out 429 responses for as long
+as their Retry-After header asks, and backs off on WebEx's gateway errors.
+Every post goes through the pooled httpclient.session.
+"""
+import io
+import json
+import zipfile
+import logging
+import threading
+from requests_toolbelt.multipart.encoder import MultipartEncoder
+import metrics
+import httpclient
+
+log = logging.getLogger(__name__)
+
+URL = 'https://webexapis.com/v1/messages'
+
+# 429 and gateway errors are retried this many times, waiting Retry-After seconds
+# or BACKOFF doubled on every attempt
+MAX_RETRIES = 5
+BACKOFF = 1
+RETRY_STATUSES = (429, 502, 503, 504)
+
+# WebEx rejects longer messages, the whole digest is in the attachment anyway
+MAX_TEXT = 7000
+
+# One digest per device, or one for the whole testscript run
+GROUPS = ('device', 'run')
+
+def post(token, room, text, attachment=None, device=None, retries=MAX_RETRIES, url=URL):
+    """Post one markdown message, attachment is a (filename, bytes, mimetype) tuple
+
+    Returns the last response; rate limited and gateway errors are retried
+    after the delay WebEx asks for, other errors are only logged.
+    """
+    headers = {'Authorization': f'Bearer { token }'}
+
+    def attempt():
+        if attachment:
+            # The encoder is consumed by the request, so every attempt builds its own
+            data = MultipartEncoder({'roomId': room, 'markdown': text, 'files': attachment})
+            headers['Content-Type'], size = data.content_type, data.len
+        else:
+            data = json.dumps({'roomId': room, 'markdown': text})
+            headers['Content-Type'], size = 'application/json', len(data)
+        with metrics.measure('call', 'webex', device) as record, httpclient.reuse(record, url):
+            record['bytes'] = size
+            return httpclient.session.post(url, data=data, headers=headers, timeout=httpclient.TIMEOUT)
+
+    # Connection errors and timeouts have no status code and are raised as they are
+    response = httpclient.retry(attempt, lambda outcome: getattr(outcome, 'status_code', None) in RETRY_STATUSES, retries, BACKOFF,
+                                lambda response: f"WebEx answered { response.status_code } { response.reason }")
+    if not response.ok:
+        log.error(f"The POST to WebEx had a response code of { response.status_code } due to { response.reason }")
+    return response
+
+class Digest:
+    """Failures of one device, or of the run, sent as one WebEx message
+
+    add() is called from the testcases and from the rasterizer's callback
+    threads, so every change happens under the lock.
+    """
+
+    def __init__(self, title):
+        self.title = title
+        self.failures = []
+        self.spoken = []
+        self.answers = []
+        self.files = []
+        self.lock = threading.Lock()
+
+    def __bool__(self):
+        return bool(self.failures)
+
+    def add(self, alias, check, failed):
+        """The failed verdicts of one check"""
+        interfaces = ', '.join(f"{ verdict.interface } ({ verdict.value })" for verdict in failed)
+        spoken = [check.spoken.format(*verdict.row, alias=alias, intf=verdict.interface) for verdict in failed]
+        with self.lock:
+            self.failures.append(f"- **{ alias }** { check.alert }: { interfaces }")
+            self.spoken.extend(spoken)
+
+    def add_answer(self, alias, question, answer):
+        with self.lock:
+            self.answers.append(f"### { alias }: { question }\n{ answer }")
+
+    def add_file(self, filename, data):
+        with self.lock:
+            self.files.append((filename, data))
+
+    @property
+    def speech(self):
+        """Every failure read out, one sentence each"""
+        return '. '.join(self.spoken)
+
+    def text(self):
+        """Full markdown of the digest"""
+        with self.lock:
+            parts = [f"## { self.title }: { len(self.failures) } failed tests", *self.failures]
+            if self.answers:
+                parts += ['', '## ChatGPT', *self.answers]
+        return '\n'.join(parts)
+
+    def archive(self):
+        """Zip of the attached files and the full text"""
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr(f"{ self.title }.md", self.text())
+            with self.lock:
+                for filename, data in self.files:
+                    archive.writestr(filename, data)
+        return buffer.getvalue()
+
+    def send(self, token, room, device=None, url=URL):
+        text = self.text()
+        if len(text) > MAX_TEXT:
+            text = text[:MAX_TEXT].rsplit('\n', 1)[0] + f"\n\n_Truncated, the full digest is in { self.title }.zip_"
+        return post(token, room, text, (f"{ self.title }.zip", self.archive(), 'application/zip'), device, url=url)
+
+class Digests:
+    """The digests of a testscript run, keyed by device alias or one for the run"""
+
+    def __init__(self, group='device', title='brainiac'):
+        self.group = group
+        self.title = title
+        self.digests = {}
+        self.lock = threading.Lock()
+
+    def __getitem__(self, alias):
+        key = alias if self.group == 'device' else None
+        with self.lock:
+            if key not in self.digests:
+                self.digests[key] = Digest(f"{ self.title } { alias }" if key else self.title)
+            return self.digests[key]
+
+    def items(self):
+        """(alias or None, digest) of every digest with failures"""
+        with self.lock:
+            return [(key, digest) for key, digest in self.digests.items() if digest]